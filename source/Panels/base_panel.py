@@ -1,9 +1,75 @@
 from PyQt5 import QtCore
-from PyQt5.QtWidgets import QWidget, QLabel
+from PyQt5.QtGui import QPainter, QPixmap, QRegion
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QFormLayout, QStyle, QStyleOption
 import math
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
-from Panels.panel_constants import TITLE_STYLE, TITLE_HEIGHT, KEY_LABEL_STYLE, KEY_LABEL_HEIGHT, VALUE_LABEL_STYLE, \
-    VALUE_LABEL_HEIGHT, INVALID_VALUE_TEXT
+from Panels.panel_constants import TITLE_HEIGHT, KEY_LABEL_HEIGHT, VALUE_LABEL_HEIGHT, INVALID_VALUE_TEXT, \
+    TITLE_OBJECT_NAME, KEY_LABEL_OBJECT_NAME, VALUE_LABEL_OBJECT_NAME, PANEL_WIDTH, PANEL_HEIGHT, PANEL_STYLESHEET, \
+    PANEL_OBJECT_NAME
+
+# Label alignments, bound once instead of looked up and or-ed on QtCore.Qt per label
+_ALIGN_CENTER = QtCore.Qt.Alignment(QtCore.Qt.AlignCenter)
+_ALIGN_RIGHT_V = QtCore.Qt.Alignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+_ALIGN_CENTER_V = QtCore.Qt.Alignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
+
+
+@lru_cache(maxsize=64)
+def _decimals_for_error(error: float) -> int:
+    """
+    Number of decimal places needed to show an error to one significant figure.
+
+    Cached because the error magnitudes seen per field come from a small set.
+    """
+    if error <= 0 or not math.isfinite(error):
+        # Handle zero, negative or non-finite error gracefully (e.g., for exact counts)
+        return 2
+    # Calculate the required number of decimal places (N)
+    # E = floor(log10(error))
+    # N = |E|
+    exponent = math.floor(math.log10(error))
+    return abs(exponent)
+
+
+@lru_cache(maxsize=64)
+def _value_template(decimal_places: int, units: Optional[str] = None) -> Callable[..., str]:
+    """
+    Bound str.format template for "value ± error" at a fixed number of decimal places.
+
+    With units, the template covers a whole value label, "(value ± error)units direction",
+    and takes the direction as a third argument.
+    """
+    spec = ":." + str(decimal_places) + "f}"
+    text = "{0" + spec + " \u00B1 {1" + spec
+    if units is not None:
+        text = "(" + text + ")" + units + " {2}"
+    return text.format
+
+
+@lru_cache(maxsize=16)
+def _value_formatter(units: str) -> Callable[[float, float, str], str]:
+    """
+    Formatter for value labels with the given units.
+
+    Produces the same text as format_variable_precision wrapped in the units template,
+    but builds the label text with a single str.format call.
+    """
+    def format_value(value: float, error: float, direction: str) -> str:
+        decimal_places = _decimals_for_error(error)
+        return _value_template(decimal_places, units)(round(value, decimal_places),
+                                                      round(error, decimal_places), direction)
+    return format_value
+
+
+def _as_finite_float(value) -> Optional[float]:
+    """Return value as a finite float, or None if it cannot be displayed."""
+    if not isinstance(value, (int, float)):
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            return None
+    return value if math.isfinite(value) else None
 
 
 def format_variable_precision(value: float, error: float) -> str:
@@ -12,16 +78,7 @@ def format_variable_precision(value: float, error: float) -> str:
     1. Rounding the error to one significant figure.
     2. Rounding the value to match the resulting decimal place of the error.
     """
-
-    if error <= 0:
-        # Handle zero or negative error gracefully (e.g., for exact counts)
-        decimal_places = 2
-    else:
-        # Calculate the required number of decimal places (N)
-        # E = floor(log10(error))
-        # N = |E|
-        exponent = math.floor(math.log10(error))
-        decimal_places = abs(exponent)
+    decimal_places = _decimals_for_error(error)
 
     # --- 1. Rounding ---
 
@@ -34,43 +91,183 @@ def format_variable_precision(value: float, error: float) -> str:
 
     # --- 2. Formatting ---
 
-    # Use f-strings to format to the calculated number of decimal places
-    formatted_value = f"{rounded_value:.{decimal_places}f}"
-    formatted_error = f"{rounded_error:.{decimal_places}f}"
+    # The value label template without units, joined with the Unicode 'PLUS-MINUS SIGN' (±).
+    return _value_template(decimal_places)(rounded_value, rounded_error)
+
+
+class _CachedPanelFrame(QWidget):
+    """
+    Panel frame that paints its border, background, title and key labels from a cached pixmap.
+
+    Only the value labels are repainted as live widgets; the static parts are rendered once
+    and re-rendered after a resize or a style change.
+    """
+
+    _INVALIDATING_EVENTS = (QtCore.QEvent.StyleChange, QtCore.QEvent.FontChange, QtCore.QEvent.PaletteChange)
+
+    def __init__(self):
+        super().__init__()
+        self._static_labels: List[QLabel] = []
+        self._backdrop: Optional[QPixmap] = None
+
+    def set_static_labels(self, labels: List[QLabel]) -> None:
+        """
+        Hand labels over to the cached backdrop; they keep their place in the layout but no longer paint.
+
+        Args:
+            labels: Child labels whose text never changes
+        """
+        self._static_labels = labels
+        for label in labels:
+            policy = label.sizePolicy()
+            policy.setRetainSizeWhenHidden(True)
+            label.setSizePolicy(policy)
+            label.hide()
+        self._backdrop = None
+
+    def _render_backdrop(self) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QPainter(pixmap)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        for label in self._static_labels:
+            label.render(painter, label.mapTo(self, QtCore.QPoint(0, 0)), QRegion(), QWidget.DrawChildren)
+        painter.end()
+        return pixmap
 
-    # Combine the results using the Unicode 'PLUS-MINUS SIGN' (±).
-    return f"{formatted_value} \u00B1 {formatted_error}"
+    def paintEvent(self, event):
+        if self._backdrop is None:
+            self._backdrop = self._render_backdrop()
+        QPainter(self).drawPixmap(0, 0, self._backdrop)
+
+    def resizeEvent(self, event):
+        self._backdrop = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() in self._INVALIDATING_EVENTS:
+            self._backdrop = None
+        super().changeEvent(event)
 
 
 class BasePanel(QWidget):
     def __init__(self):
         super().__init__()
+        # Last text pushed to each label, so unchanged values skip QLabel.setText
+        self._last_text: Dict[QLabel, str] = {}
+        # Last (value, err, units, dir) shown in each value label, so repeated inputs skip formatting entirely
+        self._last_inputs: Dict[QLabel, tuple] = {}
+
+    # Per-kind (height, alignment, object name); styling comes from the panel stylesheet via the object name
+    _LABEL_KINDS = {
+        "title": (TITLE_HEIGHT, _ALIGN_CENTER, TITLE_OBJECT_NAME),
+        "key": (KEY_LABEL_HEIGHT, _ALIGN_RIGHT_V, KEY_LABEL_OBJECT_NAME),
+        "value": (VALUE_LABEL_HEIGHT, _ALIGN_CENTER_V, VALUE_LABEL_OBJECT_NAME),
+    }
 
-    @staticmethod
-    def create_title_label(title):
-        label = QLabel(title)
-        label.setStyleSheet(TITLE_STYLE)
-        label.setAlignment(QtCore.Qt.AlignCenter)
-        label.setFixedHeight(TITLE_HEIGHT)
+    @classmethod
+    def _make_label(cls, text, kind):
+        height, alignment, object_name = cls._LABEL_KINDS[kind]
+        label = QLabel(text)
+        label.setObjectName(object_name)
+        label.setAlignment(alignment)
+        label.setFixedHeight(height)
         return label
 
+    @classmethod
+    def create_title_label(cls, title):
+        return cls._make_label(title, "title")
+
     def create_key_label(self, key):
-        label = QLabel(key)
-        label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-        label.setStyleSheet(KEY_LABEL_STYLE)
-        label.setFixedHeight(KEY_LABEL_HEIGHT)
-        return label
+        return self._make_label(key, "key")
 
     def create_value_label(self, value):
-        label = QLabel(value)
-        label.setStyleSheet(VALUE_LABEL_STYLE)
-        label.setFixedHeight(VALUE_LABEL_HEIGHT)
-        label.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
-        return label
+        return self._make_label(value, "value")
+
+    def create_value_label_with_format(self, value, units) -> Tuple[QLabel, Callable[[float, float, str], str]]:
+        """
+        Create a value label together with a pre-built text formatter for its units.
+
+        Args:
+            value: Initial label text
+            units: Units suffix shown after the value (e.g. "°", " m")
+
+        Returns:
+            Tuple of (label, formatter) where formatter(value, error, direction) builds the label text
+        """
+        return self.create_value_label(value), _value_formatter(units)
+
+    def _build_frame(self, title: str, rows: List[Tuple[str, QLabel]], width: int = PANEL_WIDTH,
+                     height: int = PANEL_HEIGHT, style: str = PANEL_STYLESHEET) -> None:
+        """
+        Build the standard panel frame: a styled, fixed-size box with a title and key/value rows.
+
+        The frame, title and key labels are drawn from a cached pixmap; only the value widgets repaint live.
+
+        Args:
+            title: Panel title text
+            rows: (key text, value label) pairs, one per form row
+            width: Panel width in pixels
+            height: Panel height in pixels
+            style: Stylesheet applied to the panel frame
+        """
+        form_layout = QFormLayout()
+        form_layout.setSpacing(0)
+        form_layout.setContentsMargins(0, 0, 0, 0)
+        form_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        # Keys sit against their values, as they did in the grid, whatever the platform style's default
+        form_layout.setLabelAlignment(_ALIGN_RIGHT_V)
+        static_labels = [self.create_title_label(title)]
+        for key, widget in rows:
+            static_labels.append(self.create_key_label(key))
+            form_layout.addRow(static_labels[-1], widget)
+
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(0)
+        main_layout.addWidget(static_labels[0])
+        main_layout.addLayout(form_layout)
+        main_layout.addStretch()
+
+        base_widget = _CachedPanelFrame()
+        base_widget.setObjectName(PANEL_OBJECT_NAME)
+        base_widget.setStyleSheet(style)
+        base_widget.setContentsMargins(0, 0, 0, 0)
+        base_widget.setFixedSize(width, height)
+        base_widget.setLayout(main_layout)
+        base_widget.set_static_labels(static_labels)
+
+        layout = QHBoxLayout()
+        layout.setSpacing(0)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(base_widget)
+        self.setLayout(layout)
+
+        # Set a fixed size for alignment
+        self.setFixedSize(width, height)
+
+    def _set_label_text(self, label: QLabel, text: str) -> None:
+        """Set label text, skipping the Qt re-layout/repaint when it is unchanged."""
+        if self._last_text.get(label) == text:
+            return
+        self._last_text[label] = text
+        label.setText(text)
 
     def _set_value_safe(self, label, value, err, units, dir = ""):
-        try:
-            val = format_variable_precision(value, err)
-            label.setText(f"({val}){units} {dir}")
-        except (ValueError, TypeError):
-            label.setText(INVALID_VALUE_TEXT)
+        key = (value, err, units, dir)
+        if self._last_inputs.get(label) == key:
+            return
+        self._last_inputs[label] = key
+        # units may be a plain suffix string or a template from create_value_label_with_format
+        formatter = _value_formatter(units) if isinstance(units, str) else units
+        # Validate up front so invalid frames (e.g. no stdev yet) don't pay for an exception
+        value = _as_finite_float(value)
+        err = _as_finite_float(err)
+        if value is None or err is None:
+            text = INVALID_VALUE_TEXT
+        else:
+            text = formatter(value, err, dir)
+        self._set_label_text(label, text)
@@ -26,14 +26,20 @@ TITLE_BACKGROUND_COLOR = "#e8e8e8"
 TEXT_COLOR = "#333333"
 VALUE_COLOR = "#000000"
 
+
+def _minify(css: str) -> str:
+    """Collapse whitespace so Qt's stylesheet parser has less to lex on every setStyleSheet call."""
+    return " ".join(css.split())
+
+
 # Styling
-PANEL_STYLE = f"""
+PANEL_STYLE = _minify(f"""
     background-color: {PANEL_BACKGROUND_COLOR};
     border: 1px solid {PANEL_BORDER_COLOR};
     border-radius: 6px;
-"""
+""")
 
-TITLE_STYLE = f"""
+TITLE_STYLE = _minify(f"""
     font-size: {TITLE_FONT_SIZE}px;
     font-weight: bold;
     color: {TEXT_COLOR};
@@ -41,19 +47,35 @@ TITLE_STYLE = f"""
     border: none;
     border-bottom: 1px solid {PANEL_BORDER_COLOR};
     padding: 4px;
-"""
+""")
 
-KEY_LABEL_STYLE = f"""
+KEY_LABEL_STYLE = _minify(f"""
     font-size: {LABEL_FONT_SIZE}px;
     color: {TEXT_COLOR};
     font-weight: 600;
     border: none;
     padding-right: 8px;
-"""
+""")
 
-VALUE_LABEL_STYLE = f"""
+VALUE_LABEL_STYLE = _minify(f"""
     font-size: {LABEL_FONT_SIZE}px;
     color: {VALUE_COLOR};
     border: none;
     padding-left: 4px;
-"""
+""")
+
+# Object names used as stylesheet selectors
+PANEL_OBJECT_NAME = "panelBase"
+TITLE_OBJECT_NAME = "panelTitle"
+KEY_LABEL_OBJECT_NAME = "panelKey"
+VALUE_LABEL_OBJECT_NAME = "panelValue"
+
+# Combined stylesheet set once on each panel frame; labels pick up their rules
+# by object name instead of parsing a stylesheet per label.
+# Titles keep the panel's rounded corners they used to inherit from PANEL_STYLE.
+PANEL_STYLESHEET = _minify(f"""
+QWidget#{PANEL_OBJECT_NAME} {{{PANEL_STYLE}}}
+QLabel#{TITLE_OBJECT_NAME} {{border-radius: 6px; {TITLE_STYLE}}}
+QLabel#{KEY_LABEL_OBJECT_NAME} {{{KEY_LABEL_STYLE}}}
+QLabel#{VALUE_LABEL_OBJECT_NAME} {{{VALUE_LABEL_STYLE}}}
+""")
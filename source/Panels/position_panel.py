@@ -1,68 +1,60 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout
-from Panels.base_panel import BasePanel
-from source.Panels.panel_constants import (
-    PANEL_WIDTH, PANEL_HEIGHT, PANEL_STYLE
-)
-
-class PositionPanel(BasePanel):
-    def __init__(self, width : int = PANEL_WIDTH, height : int = PANEL_HEIGHT, style : str =PANEL_STYLE):
-        super().__init__()
-        grid_layout, self.latitude, self.longitude, self.height = self.create_position_layout()
-        main_layout = QVBoxLayout()
-        main_layout.addWidget(self.create_title_label("Position"))
-        main_layout.addLayout(grid_layout)
-        main_layout.addStretch()
-        base_widget = QWidget()
-        base_widget.setStyleSheet(style)
-        base_widget.setContentsMargins(0, 0, 0, 0)
-        base_widget.setFixedWidth(width)
-        base_widget.setFixedHeight(height)
-        main_layout.setSpacing(0)
-        base_widget.setLayout(main_layout)
-
-        layout = QHBoxLayout()
-        layout.setSpacing(0)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(base_widget)
-        self.setLayout(layout)
-
-        # Set a fixed size for alignment
-        self.setFixedSize(width, height)
-
+from operator import attrgetter
+from typing import Optional
 
-    # private functions
-    def create_position_layout(self):
-        grid_layout = QGridLayout()
-        grid_layout.setSpacing(0)
-        grid_layout.setContentsMargins(0, 0, 0, 0)
+from PyQt5.QtCore import QTimer
 
-        latitude_label = self.create_value_label("0.0")
-        longitude_label = self.create_value_label("0.0")
-        height_label = self.create_value_label("0.0")
+from gps_data import PositionInfo
+from Panels.base_panel import BasePanel
+from source.Panels.panel_constants import PANEL_WIDTH, PANEL_HEIGHT, PANEL_STYLESHEET
 
-        fields = [("Latitude: ", latitude_label), ("Longitude: ", longitude_label), ("Height: ", height_label)]
-        for row, (key, widget) in enumerate(fields):
-            grid_layout.addWidget(self.create_key_label(key), row, 0)
-            grid_layout.addWidget(widget, row, 1)
+class PositionPanel(BasePanel):
+    # Pulls every field set_position needs out of the PositionInfo in one call
+    _POSITION_FIELDS = attrgetter('latitude', 'lat_dir', 'lat_err', 'longitude', 'lon_dir', 'lon_err',
+                                  'height', 'height_err')
 
-        return grid_layout, latitude_label, longitude_label, height_label
+    def __init__(self, width : int = PANEL_WIDTH, height : int = PANEL_HEIGHT, style : str =PANEL_STYLESHEET):
+        super().__init__()
+        self.latitude, self._latitude_format = self.create_value_label_with_format("0.0", "°")
+        self.longitude, self._longitude_format = self.create_value_label_with_format("0.0", "°")
+        self.height, self._height_format = self.create_value_label_with_format("0.0", " m")
+        self._build_frame("Position", [("Latitude: ", self.latitude), ("Longitude: ", self.longitude),
+                                       ("Height: ", self.height)], width, height, style)
+
+        # Latest position waiting to be shown; bursts of updates collapse into one flush per event-loop pass
+        self._pending: Optional[PositionInfo] = None
+        # Most recent position requested; an equal one needs no flush (and no repaint)
+        self._requested: Optional[PositionInfo] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
 
     # public functions
     def set_latitude(self, latitude: float, lat_dir: str, lat_err:float = 1.0e-6) -> None:
-        self._set_value_safe(self.latitude, latitude, lat_err, "°", lat_dir)
+        self._set_value_safe(self.latitude, latitude, lat_err, self._latitude_format, lat_dir)
 
     def set_longitude(self, longitude: float, lon_dir: str, lon_err:float = 1.0e-6) -> None:
-        self._set_value_safe(self.longitude, longitude, lon_err, "°", lon_dir)
+        self._set_value_safe(self.longitude, longitude, lon_err, self._longitude_format, lon_dir)
 
     def set_height(self, height: float, height_err:float = 0.1) -> None:
-        self._set_value_safe(self.height, height, height_err, " m")
-
-    def set_position(self, latitude: float, lat_dir: str, longitude: float, lon_dir: str, height: float) -> None:
-        self.set_latitude(latitude, lat_dir)
-        self.set_longitude(longitude, lon_dir)
-        self.set_height(height)
+        self._set_value_safe(self.height, height, height_err, self._height_format)
 
     def set_position(self, p):
-        self.set_latitude(p['latitude'], p['lat_dir'], p['lat_err'])
-        self.set_longitude(p['longitude'], p['lon_dir'], p['lon_err'])
-        self.set_height(p['height'], p['height_err'])
+        if p == self._requested:
+            return
+        self._requested = p
+        self._pending = p
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(0)
+
+    # private functions
+    def _flush(self):
+        p, self._pending = self._pending, None
+        if p is not None:
+            self._apply(p)
+
+    def _apply(self, p):
+        # QLabel.setText schedules its own repaint; updates in one pass are painted together
+        lat, lat_dir, lat_err, lon, lon_dir, lon_err, height, height_err = self._POSITION_FIELDS(p)
+        self.set_latitude(lat, lat_dir, lat_err)
+        self.set_longitude(lon, lon_dir, lon_err)
+        self.set_height(height, height_err)
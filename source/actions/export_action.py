@@ -35,6 +35,9 @@ class ExportAction(BaseAction):
         self.data_exporter = data_exporter
         self.parent_widget = parent_widget
         self.status_callback = status_callback
+        # Created on first use and reused, so later exports don't rebuild the dialogs
+        self._file_dialog: Optional[QFileDialog] = None
+        self._message_box: Optional[QMessageBox] = None
 
     def can_execute(self) -> bool:
         """Check if export can be performed."""
@@ -70,15 +73,17 @@ class ExportAction(BaseAction):
         Returns:
             Filename or None if cancelled
         """
-        default_filename = self.data_exporter.generate_default_filename()
-        file_filter = self.data_exporter.get_file_filter()
-        filename, _ = QFileDialog.getSaveFileName(
-            self.parent_widget,
-            "Export GPS Data",
-            default_filename,
-            file_filter
-        )
-        return filename if filename else None
+        dialog = self._file_dialog
+        if dialog is None:
+            dialog = QFileDialog(self.parent_widget, "Export GPS Data")
+            dialog.setAcceptMode(QFileDialog.AcceptSave)
+            dialog.setNameFilter(self.data_exporter.get_file_filter())
+            self._file_dialog = dialog
+        dialog.selectFile(self.data_exporter.generate_default_filename())
+        if dialog.exec_() != QFileDialog.Accepted:
+            return None
+        files = dialog.selectedFiles()
+        return files[0] if files else None
 
     def _handle_export_success(self, filename: str) -> None:
         """Handle successful export."""
@@ -86,8 +91,8 @@ class ExportAction(BaseAction):
         if self.status_callback:
             self.status_callback(f"GPS data exported to {basename}", 3000)
 
-        QMessageBox.information(
-            self.parent_widget,
+        self._show_message(
+            QMessageBox.Information,
             "Export Successful",
             f"GPS data successfully exported to:\n{filename}"
         )
@@ -101,4 +106,15 @@ class ExportAction(BaseAction):
 
     def _show_error(self, title: str, message: str) -> None:
         """Show error dialog."""
-        QMessageBox.warning(self.parent_widget, title, message)
+        self._show_message(QMessageBox.Warning, title, message)
+
+    def _show_message(self, icon: QMessageBox.Icon, title: str, message: str) -> None:
+        """Show a modal message in the shared message box."""
+        box = self._message_box
+        if box is None:
+            box = QMessageBox(self.parent_widget)
+            self._message_box = box
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(message)
+        box.exec_()
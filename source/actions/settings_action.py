@@ -5,7 +5,6 @@ from typing import Callable, Optional
 from PyQt5.QtWidgets import QWidget
 
 from .base_action import BaseAction
-from settings_dialog import SettingsDialog
 from settings_mediator import SettingsMediator
 
 
@@ -35,6 +34,9 @@ class SettingsAction(BaseAction):
 
     def execute(self) -> None:
         """Execute the settings action."""
+        # Imported on first use: the dialog pulls in PyQt5.QtSerialPort, which startup never needs
+        from settings_dialog import SettingsDialog
+
         # Get current settings
         current_settings = self.settings_mediator.get_current_settings()
 
@@ -3,10 +3,32 @@ Application styling and theme configuration.
 Centralizes all visual appearance settings for the GPS application.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 
 from PyQt5.QtGui import QFont, QPalette, QColor
 
 
+# Built once per distinct setting. AppStyle is a mutable, unhashable dataclass, so the caches
+# are keyed on the field values rather than on the instance. Qt copies fonts and palettes
+# when they are applied, so sharing one instance is safe as long as callers don't modify it.
+@lru_cache(maxsize=None)
+def _font(family: str, size: int) -> QFont:
+    return QFont(family, size)
+
+
+@lru_cache(maxsize=None)
+def _palette(window_background_color: tuple) -> QPalette:
+    palette = QPalette()
+    r, g, b = window_background_color
+    palette.setColor(QPalette.Window, QColor(r, g, b))
+    return palette
+
+
+@lru_cache(maxsize=None)
+def _window_stylesheet(window_border: str) -> str:
+    return f"border: {window_border};"
+
+
 @dataclass
 class AppStyle:
     """
@@ -34,21 +56,18 @@ class AppStyle:
         Create QFont from configuration.
 
         Returns:
-            Configured QFont instance
+            Configured QFont instance (shared; do not modify)
         """
-        return QFont(self.font_family, self.font_size)
+        return _font(self.font_family, self.font_size)
 
     def get_palette(self) -> QPalette:
         """
         Create QPalette from configuration.
 
         Returns:
-            Configured QPalette instance with window background color
+            Configured QPalette instance with window background color (shared; do not modify)
         """
-        palette = QPalette()
-        r, g, b = self.window_background_color
-        palette.setColor(QPalette.Window, QColor(r, g, b))
-        return palette
+        return _palette(tuple(self.window_background_color))
 
     def get_window_stylesheet(self) -> str:
         """
@@ -57,7 +76,7 @@ class AppStyle:
         Returns:
             CSS stylesheet string
         """
-        return f"border: {self.window_border};"
+        return _window_stylesheet(self.window_border)
 
 
 # Default style configuration
@@ -3,14 +3,27 @@ Command Formatter for generating GPS-related commands.
 Formats GPS data into various command formats (Meshtastic, etc.).
 """
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Optional
 
 from gps_data import GPSData
 
+# Fields a position-only command depends on, read from a GPSData in one call
+_POSITION_FIELDS = attrgetter('latitude', 'longitude', 'height')
+# Fields the NMEA GGA summary depends on, read the same way
+_GGA_FIELDS = attrgetter('latitude', 'longitude', 'height', 'num_sats', 'lat_dir', 'lon_dir')
+
 
 class CommandFormatter(ABC):
     """Abstract base class for command formatters."""
 
+    def __init__(self) -> None:
+        # Fields used for the last formatted command and its text; unchanged data reuses the string
+        self._cache_key: Optional[tuple] = None
+        self._cache_value = ""
+        # Last string handed out by format_if_changed
+        self._last_emitted: Optional[str] = None
+
     @abstractmethod
     def format(self, gps_data: Optional[GPSData]) -> str:
         """
@@ -24,6 +37,25 @@ class CommandFormatter(ABC):
         """
         pass
 
+    def format_if_changed(self, gps_data: Optional[GPSData]) -> Optional[str]:
+        """
+        Format GPS data, but only return the command when it differs from the last one returned.
+
+        format() hands back the same string object while its inputs are unchanged (and the
+        same placeholder object while there is no position), so an identity check suffices.
+
+        Args:
+            gps_data: GPS data to format (None if no data available)
+
+        Returns:
+            Formatted command string, or None if it is the one returned last time
+        """
+        command = self.format(gps_data)
+        if command is self._last_emitted:
+            return None
+        self._last_emitted = command
+        return command
+
     @abstractmethod
     def get_placeholder(self) -> str:
         """
@@ -42,6 +74,11 @@ class MeshtasticCommandFormatter(CommandFormatter):
     Meshtastic is a project for long-range mesh networking.
     """
 
+    _PLACEHOLDER = "meshtastic --setlat N/A --setlon N/A --setalt N/A"
+    _LAT_PREFIX = "meshtastic --setlat "
+    _LON_PREFIX = " --setlon "
+    _ALT_PREFIX = " --setalt "
+
     def format(self, gps_data: Optional[GPSData]) -> str:
         """
         Format GPS data into Meshtastic command.
@@ -52,12 +89,22 @@ class MeshtasticCommandFormatter(CommandFormatter):
         Returns:
             Meshtastic command string
         """
-        if not gps_data or not gps_data.has_position():
-            return self.get_placeholder()
-
-        return (f"meshtastic --setlat {gps_data.latitude} "
-                f"--setlon {gps_data.longitude} "
-                f"--setalt {gps_data.height}")
+        if gps_data is None:
+            return self._PLACEHOLDER
+
+        # The position check runs only when the cached fields change
+        key = _POSITION_FIELDS(gps_data)
+        if key != self._cache_key:
+            self._cache_key = key
+            if not gps_data.has_position():
+                self._cache_value = self._PLACEHOLDER
+                return self._cache_value
+            # repr() gives the same shortest round-trip text as the f-string, without the format machinery
+            latitude, longitude, height = key
+            self._cache_value = "".join((self._LAT_PREFIX, repr(latitude),
+                                         self._LON_PREFIX, repr(longitude),
+                                         self._ALT_PREFIX, repr(height)))
+        return self._cache_value
 
     def get_placeholder(self) -> str:
         """
@@ -66,7 +113,7 @@ class MeshtasticCommandFormatter(CommandFormatter):
         Returns:
             Placeholder command string
         """
-        return "meshtastic --setlat N/A --setlon N/A --setalt N/A"
+        return self._PLACEHOLDER
 
 
 class NMEACommandFormatter(CommandFormatter):
@@ -76,6 +123,8 @@ class NMEACommandFormatter(CommandFormatter):
     Example output: $GPGGA sentence
     """
 
+    _PLACEHOLDER = "$GPGGA,N/A,N/A,N/A"
+
     def format(self, gps_data: Optional[GPSData]) -> str:
         """
         Format GPS data into NMEA GGA sentence.
@@ -86,21 +135,33 @@ class NMEACommandFormatter(CommandFormatter):
         Returns:
             NMEA GGA sentence string
         """
-        if not gps_data or not gps_data.has_position():
-            return self.get_placeholder()
+        if gps_data is None:
+            return self._PLACEHOLDER
 
-        # Simplified NMEA GGA format (without checksum for display)
-        lat_deg = int(abs(gps_data.latitude))
-        lat_min = (abs(gps_data.latitude) - lat_deg) * 60
-        lat_dir = gps_data.lat_dir or ('N' if gps_data.latitude >= 0 else 'S')
-
-        lon_deg = int(abs(gps_data.longitude))
-        lon_min = (abs(gps_data.longitude) - lon_deg) * 60
-        lon_dir = gps_data.lon_dir or ('E' if gps_data.longitude >= 0 else 'W')
+        key = _GGA_FIELDS(gps_data)
+        if key == self._cache_key:
+            return self._cache_value
+        self._cache_key = key
+        if not gps_data.has_position():
+            self._cache_value = self._PLACEHOLDER
+            return self._cache_value
 
-        return (f"$GPGGA,{lat_deg:02d}{lat_min:07.4f},{lat_dir},"
-                f"{lon_deg:03d}{lon_min:07.4f},{lon_dir},"
-                f"Alt:{gps_data.height:.1f}m,Sats:{gps_data.num_sats}")
+        # Simplified NMEA GGA format (without checksum for display)
+        lat, lon, height, num_sats, lat_dir, lon_dir = key
+        abs_lat = abs(lat)
+        lat_deg = int(abs_lat)
+        lat_min = (abs_lat - lat_deg) * 60
+        lat_dir = lat_dir or ('N' if lat >= 0 else 'S')
+
+        abs_lon = abs(lon)
+        lon_deg = int(abs_lon)
+        lon_min = (abs_lon - lon_deg) * 60
+        lon_dir = lon_dir or ('E' if lon >= 0 else 'W')
+
+        self._cache_value = (f"$GPGGA,{lat_deg:02d}{lat_min:07.4f},{lat_dir},"
+                             f"{lon_deg:03d}{lon_min:07.4f},{lon_dir},"
+                             f"Alt:{height:.1f}m,Sats:{num_sats}")
+        return self._cache_value
 
     def get_placeholder(self) -> str:
         """
@@ -109,7 +170,7 @@ class NMEACommandFormatter(CommandFormatter):
         Returns:
             Placeholder NMEA string
         """
-        return "$GPGGA,N/A,N/A,N/A"
+        return self._PLACEHOLDER
 
 
 class SimpleCommandFormatter(CommandFormatter):
@@ -119,6 +180,8 @@ class SimpleCommandFormatter(CommandFormatter):
     Example: "Lat: 48.4034, Lon: -123.5448, Alt: 114.1m"
     """
 
+    _PLACEHOLDER = "Lat: N/A, Lon: N/A, Alt: N/A"
+
     def format(self, gps_data: Optional[GPSData]) -> str:
         """
         Format GPS data into simple coordinate string.
@@ -129,12 +192,18 @@ class SimpleCommandFormatter(CommandFormatter):
         Returns:
             Simple coordinate string
         """
-        if not gps_data or not gps_data.has_position():
-            return self.get_placeholder()
+        if gps_data is None:
+            return self._PLACEHOLDER
 
-        return (f"Lat: {gps_data.latitude:.4f}°, "
-                f"Lon: {gps_data.longitude:.4f}°, "
-                f"Alt: {gps_data.height:.1f}m")
+        key = _POSITION_FIELDS(gps_data)
+        if key != self._cache_key:
+            self._cache_key = key
+            if not gps_data.has_position():
+                self._cache_value = self._PLACEHOLDER
+                return self._cache_value
+            latitude, longitude, height = key
+            self._cache_value = f"Lat: {latitude:.4f}°, Lon: {longitude:.4f}°, Alt: {height:.1f}m"
+        return self._cache_value
 
     def get_placeholder(self) -> str:
         """
@@ -143,4 +212,4 @@ class SimpleCommandFormatter(CommandFormatter):
         Returns:
             Placeholder string
         """
-        return "Lat: N/A, Lon: N/A, Alt: N/A"
+        return self._PLACEHOLDER
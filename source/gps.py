@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from gps_data import GPSData
 from nmea_parser import NMEAParser
@@ -6,6 +7,9 @@ from serial_port import ISerialPort, SerialPort
 
 logger = logging.getLogger(__name__)
 
+# NMEA 0183 caps a sentence at 82 characters; a longer unterminated fragment is line noise
+MAX_PARTIAL_SENTENCE = 1024
+
 
 class GT_U7GPS:
     def __init__(self, port='/dev/tty.usbmodem2101', baudrate=9600, timeout=1, serial_port: ISerialPort = None):
@@ -18,6 +22,7 @@ class GT_U7GPS:
             timeout: Read timeout in seconds (used if serial_port not provided)
             serial_port: Optional ISerialPort implementation for dependency injection
         """
+        self.ser: Optional[ISerialPort] = None
         if serial_port is None:
             self.ser = SerialPort(port, baudrate, timeout)
         else:
@@ -26,6 +31,8 @@ class GT_U7GPS:
         logger.info("GPS connected!")
         self._data = GPSData()
         self._parser = NMEAParser(self._data)
+        # Bytes received after the last complete sentence, carried over to the next read
+        self._rx_buf = bytearray()
 
     @property
     def data(self) -> GPSData:
@@ -62,25 +69,61 @@ class GT_U7GPS:
         return self._data.gps_quality
 
     def close(self):
-        if hasattr(self, 'ser') and self.ser.is_open():
-            self.ser.close()
+        ser = self.ser
+        if ser is not None and ser.is_open():
+            ser.close()
+            self.ser = None
             logger.debug("GPS disconnected!")
 
-    def _read_nmea_sentence(self):
-        """Read and decode a single NMEA sentence from serial port."""
-        try:
-            return self.ser.readline().decode('utf-8').strip()
-        except UnicodeDecodeError as e:
-            logger.error(f"Error decoding NMEA: {e}")
-            return None
+    def cancel_read(self):
+        """Wake a read blocked in read_gps_data(wait=True) from another thread."""
+        ser = self.ser
+        if ser is not None:
+            ser.cancel_read()
+
+    def read_gps_data(self, wait: bool = False) -> bool:
+        """
+        Read and process all available GPS data from serial port.
 
-    def read_gps_data(self):
-        """Read and process all available GPS data from serial port."""
+        Args:
+            wait: If nothing is waiting, block until the first byte arrives (bounded by
+                the port's read timeout) instead of returning straight away
+
+        Returns:
+            True if any bytes were received
+
+        Raises:
+            RuntimeError: If the port is closed or cannot be read
+        """
+        ser = self.ser
+        if ser is None:
+            raise RuntimeError("Failed to read GPS serial port: port is closed")
         try:
-            while self.ser.in_waiting() > 0:
-                nmea_sentence = self._read_nmea_sentence()
-                if nmea_sentence:
-                    self._parser.parse_sentence(nmea_sentence)
+            waiting = ser.in_waiting()
+            if waiting:
+                received = ser.read(waiting)
+            elif wait:
+                received = ser.read(1)
+                # The rest of the burst has usually landed by the time the first byte wakes us
+                waiting = ser.in_waiting() if received else 0
+                if waiting:
+                    received += ser.read(waiting)
+            else:
+                return False
+            if not received:
+                return False
+            rx_buf = self._rx_buf
+            rx_buf += received
+            end = rx_buf.rfind(b'\n')
+            # NMEA is 7-bit ASCII: decode all complete sentences in one pass, dropping stray bytes
+            text = rx_buf[:end].decode('ascii', 'ignore') if end >= 0 else ''
+            # Consume in place so the same buffer is reused across reads
+            del rx_buf[:end + 1]
+            if len(rx_buf) > MAX_PARTIAL_SENTENCE:
+                rx_buf.clear()
+            if text:
+                self._parser.parse_buffer(text)
+            return True
         except Exception as e:
-            logger.error(f"Error reading serial port: {e}")
+            logger.error("Error reading serial port: %s", e)
             raise RuntimeError(f"Failed to read GPS serial port: {e}")
@@ -5,11 +5,32 @@ Manages connection, reconnection, and disconnection logic.
 import logging
 from typing import Optional, Callable
 
+from PyQt5 import QtCore
+
 from gps import GT_U7GPS
+from gps_data import GPSData
+from gps_reader_thread import GPSReaderThread
 
 logger = logging.getLogger(__name__)
 
 
+class _PortOpener(QtCore.QThread):
+    """Opens a GPS serial port off the calling thread; the outcome is read after `finished`."""
+
+    def __init__(self, port: str, baudrate: int):
+        super().__init__()
+        self.port = port
+        self.baudrate = baudrate
+        self.gps: Optional[GT_U7GPS] = None
+        self.error: Optional[RuntimeError] = None
+
+    def run(self):
+        try:
+            self.gps = GT_U7GPS(port=self.port, baudrate=self.baudrate)
+        except RuntimeError as e:
+            self.error = e
+
+
 class GPSConnectionManager:
     """
     Manages GPS device connection lifecycle.
@@ -18,7 +39,8 @@ class GPSConnectionManager:
     providing callbacks for status updates.
     """
 
-    def __init__(self, port: str, baudrate: int, status_callback: Callable[[str], None] = None):
+    def __init__(self, port: str, baudrate: int, status_callback: Callable[[str], None] = None,
+                 data_callback: Callable[[GPSData], None] = None, error_callback: Callable[[str], None] = None):
         """
         Initialize GPS connection manager.
 
@@ -26,18 +48,33 @@ class GPSConnectionManager:
             port: Serial port path for GPS device
             baudrate: Serial communication speed
             status_callback: Optional callback function for status messages
+            data_callback: Optional callback for each snapshot the reader publishes
+            error_callback: Optional callback for the error message of a failed read
+
+        The data and error callbacks are invoked through queued Qt signals, so they
+        run on the thread that created the manager rather than on the reader thread.
         """
         self.port = port
         self.baudrate = baudrate
         self.status_callback = status_callback
+        self.data_callback = data_callback
+        self.error_callback = error_callback
         self._gps: Optional[GT_U7GPS] = None
+        self._reader: Optional[GPSReaderThread] = None
         self._reconnecting = False
+        # Port being opened by reconnect_async, if any
+        self._opener: Optional[_PortOpener] = None
 
     @property
     def gps(self) -> Optional[GT_U7GPS]:
         """Get current GPS instance."""
         return self._gps
 
+    @property
+    def reader(self) -> Optional[GPSReaderThread]:
+        """Get the background reader for the current GPS instance."""
+        return self._reader
+
     @property
     def is_connected(self) -> bool:
         """Check if GPS is currently connected."""
@@ -55,7 +92,9 @@ class GPSConnectionManager:
         Args:
             gps_instance: GPS instance to inject
         """
+        self._stop_reader()
         self._gps = gps_instance
+        self._start_reader()
 
     def connect(self) -> bool:
         """
@@ -64,20 +103,14 @@ class GPSConnectionManager:
         Returns:
             True if connection successful, False otherwise
         """
-        try:
-            self._gps = GT_U7GPS(port=self.port, baudrate=self.baudrate)
-            logger.info(f"GPS connected on {self.port} at {self.baudrate} baud")
-            self._notify_status("GPS connected successfully!")
-            return True
-        except RuntimeError as e:
-            logger.error(f"Failed to connect to GPS: {e}")
-            self._notify_status(f"GPS connection failed: {e}")
-            self._gps = None
-            return False
+        return self._connect() is None
 
     def disconnect(self):
-        """Disconnect from GPS device."""
+        """Disconnect from GPS device, abandoning any reconnect_async still opening the port."""
+        self._cancel_open()
         if self._gps:
+            # The reader must be idle before the port underneath it closes
+            self._stop_reader()
             self._gps.close()
             self._gps = None
             logger.info("GPS disconnected")
@@ -90,30 +123,42 @@ class GPSConnectionManager:
         Returns:
             True if reconnection successful, False otherwise
         """
-        if self._reconnecting:
-            logger.debug("Reconnection already in progress")
+        if not self._begin_reconnect():
             return False
 
-        self._reconnecting = True
-        self._notify_status("Attempting to reconnect to GPS...")
-        logger.info("Attempting GPS reconnection...")
+        try:
+            # Disconnect existing connection if any
+            self.disconnect()
 
-        # Disconnect existing connection if any
-        self.disconnect()
+            # Attempt new connection
+            error = self._connect()
+        finally:
+            self._reconnecting = False
 
-        # Attempt new connection
-        success = self.connect()
+        self._report_reconnect(error)
+        return error is None
 
-        self._reconnecting = False
+    def reconnect_async(self) -> None:
+        """
+        Attempt to reconnect to GPS device without blocking on opening the port.
 
-        if success:
-            logger.info("GPS reconnection successful")
-            self._notify_status("GPS reconnected successfully!")
-        else:
-            logger.warning("GPS reconnection failed")
-            self._notify_status("GPS reconnection failed")
+        Opening a serial port can take from hundreds of milliseconds to seconds, so it
+        runs on a worker thread. The reader is started and the outcome reported back on
+        this thread once the port is open, so it must run a Qt event loop.
+        """
+        if not self._begin_reconnect():
+            return
 
-        return success
+        try:
+            self.disconnect()
+            opener = _PortOpener(self.port, self.baudrate)
+            # Bound to this opener, so a late signal from an abandoned one is recognised
+            opener.finished.connect(lambda: self._on_port_opened(opener))
+            opener.start()
+        except BaseException:
+            self._reconnecting = False
+            raise
+        self._opener = opener
 
     def update_connection_params(self, port: str = None, baudrate: int = None):
         """
@@ -128,15 +173,111 @@ class GPSConnectionManager:
         if baudrate is not None:
             self.baudrate = baudrate
 
-        logger.info(f"Connection parameters updated: {self.port} @ {self.baudrate} baud")
+        logger.info("Connection parameters updated: %s @ %s baud", self.port, self.baudrate)
+        # A reconnect_async still opening the old port would make reconnect() a no-op
+        self._cancel_open()
         self.reconnect()
 
-    def _notify_status(self, message: str):
+    def _begin_reconnect(self) -> bool:
+        """Mark a reconnection as started, unless one is already in progress."""
+        if self._reconnecting:
+            logger.debug("Reconnection already in progress")
+            return False
+
+        self._notify_status("Attempting to reconnect to GPS...")
+        logger.info("Attempting GPS reconnection...")
+        self._reconnecting = True
+        return True
+
+    def _report_reconnect(self, error: Optional[RuntimeError]):
+        """Log and report the outcome of a reconnection, with the reason if it failed."""
+        if error is None:
+            logger.info("GPS reconnection successful")
+            self._notify_status("GPS reconnected successfully!")
+        else:
+            logger.warning("GPS reconnection failed: %s", error)
+            self._notify_status("GPS reconnection failed: %s", error)
+
+    def _connect(self) -> Optional[RuntimeError]:
+        """Open the port and start reading it; returns the error if it could not be opened."""
+        try:
+            gps = GT_U7GPS(port=self.port, baudrate=self.baudrate)
+        except RuntimeError as e:
+            self._connection_failed(e)
+            return e
+        self._connected(gps)
+        return None
+
+    def _connected(self, gps: GT_U7GPS):
+        """Adopt a newly opened GPS instance and start reading it."""
+        self._gps = gps
+        self._start_reader()
+        logger.info("GPS connected on %s at %s baud", self.port, self.baudrate)
+        self._notify_status("GPS connected successfully!")
+
+    def _connection_failed(self, error: RuntimeError):
+        """Report a GPS port that could not be opened."""
+        logger.error("Failed to connect to GPS: %s", error)
+        self._notify_status("GPS connection failed: %s", error)
+        self._gps = None
+
+    def _on_port_opened(self, opener: _PortOpener):
+        """Finish a reconnect_async once its worker has opened the port (or failed to)."""
+        if opener is not self._opener:
+            # Abandoned by disconnect(), which has already dealt with the port
+            return
+        self._opener = None
+        # finished is emitted as run() returns; wait() just joins the exiting thread
+        opener.wait()
+        try:
+            if opener.gps is None:
+                assert opener.error is not None, "_PortOpener sets either gps or error"
+                self._connection_failed(opener.error)
+            else:
+                self._connected(opener.gps)
+        finally:
+            self._reconnecting = False
+        self._report_reconnect(opener.error)
+
+    def _cancel_open(self):
+        """Abandon a pending reconnect_async, closing the port if it opened meanwhile."""
+        opener, self._opener = self._opener, None
+        if opener is None:
+            return
+        opener.wait()
+        if opener.gps is not None:
+            opener.gps.close()
+        self._reconnecting = False
+
+    def _start_reader(self):
+        """Start reading the current GPS instance on a background thread."""
+        self._reader = GPSReaderThread(self._gps)
+        if self.data_callback:
+            self._reader.snapshot_ready.connect(self.data_callback)
+        if self.error_callback:
+            self._reader.read_failed.connect(self.error_callback)
+        self._reader.start()
+
+    def _stop_reader(self):
+        """Stop the background reader, if running."""
+        if self._reader:
+            self._reader.stop()
+            self._reader = None
+
+    def _notify_status(self, message: str, *args):
         """
         Send status message via callback if available.
 
+        The message is only formatted when there is a callback to receive it. While
+        reconnecting, the inner disconnect/connect messages are dropped: reconnect()
+        reports the outcome itself, including why the port could not be opened.
+
         Args:
-            message: Status message to send
+            message: Status message to send, optionally with %-style placeholders
+            *args: Values for the placeholders in message
         """
-        if self.status_callback:
-            self.status_callback(message)
+        if not self.status_callback:
+            return
+        if self._reconnecting:
+            return
+        self.status_callback(message % args if args else message)
@@ -6,9 +6,9 @@ reducing coupling and complexity in client code.
 """
 from typing import Optional, Dict, Any, Tuple
 
-from gps_data import GPSData
+from gps_data import GPSData, PositionInfo, SatelliteInfo
 from gps_connection_manager import GPSConnectionManager
-from gps_data_controller import GPSDataController
+from gps_data_controller import GPSDataController, REFRESHING_MESSAGE
 from gps_update_controller import GPSUpdateController
 from settings_mediator import SettingsMediator
 from protocols import (
@@ -49,12 +49,13 @@ class GPSControllerFacade:
     @property
     def is_connected(self) -> bool:
         """Check if GPS is connected."""
-        return self._data_controller.is_connected
+        # Ask the connection manager directly rather than hopping through the data controller
+        return self._connection_manager.is_connected
 
     @property
     def is_reconnecting(self) -> bool:
         """Check if GPS is reconnecting."""
-        return self._settings_mediator.is_reconnecting()
+        return self._connection_manager.is_reconnecting
 
     def inject_gps_instance(self, gps_instance) -> None:
         """
@@ -63,7 +64,7 @@ class GPSControllerFacade:
         Args:
             gps_instance: GPS instance to inject
         """
-        self._connection_manager._gps = gps_instance
+        self._connection_manager.inject_gps_instance(gps_instance)
 
     def connect(self) -> bool:
         """
@@ -88,21 +89,21 @@ class GPSControllerFacade:
         """
         return self._data_controller.get_current_data()
 
-    def get_satellite_info(self) -> Dict[str, Any]:
+    def get_satellite_info(self) -> SatelliteInfo:
         """
         Get satellite information.
 
         Returns:
-            Dictionary with num_sats and gps_quality
+            SatelliteInfo with num_sats and gps_quality
         """
         return self._data_controller.get_satellite_info()
 
-    def get_position_info(self) -> Dict[str, Any]:
+    def get_position_info(self) -> PositionInfo:
         """
         Get position information.
 
         Returns:
-            Dictionary with latitude, longitude, height and directions
+            PositionInfo with latitude, longitude, height, their errors and directions
         """
         return self._data_controller.get_position_info()
 
@@ -129,7 +130,7 @@ class GPSControllerFacade:
         simple_callback = None
         if status_callback:
             def simple_callback(msg: str):
-                duration = 1000 if "Refreshing" in msg else 2000
+                duration = 1000 if msg == REFRESHING_MESSAGE else 2000
                 status_callback(msg, duration)
 
         return self._data_controller.manual_refresh(status_callback=simple_callback)
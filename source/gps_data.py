@@ -1,10 +1,15 @@
 """
 GPS data model for storing position, altitude, and satellite information.
 """
+import sys
 from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional, Tuple
 
+# Slotted instances (Python 3.10+) are smaller and skip the per-instance __dict__ on every field access
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class GPSData:
     """
     Data model for GPS position and status information.
@@ -34,6 +39,31 @@ class GPSData:
         """Check if position data is available."""
         return self.latitude != 0.0 or self.longitude != 0.0
 
+    def reset(self) -> None:
+        """Restore every field to its default value, reusing this instance."""
+        self.latitude = 0.0
+        self.longitude = 0.0
+        self.lat_dir = ''
+        self.lon_dir = ''
+        self.height = 0.0
+        self.num_sats = 0
+        self.gps_quality = 0
+
+    def items(self) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Get (field name, value) pairs, so callers can build whatever container they need.
+
+        Returns:
+            Tuple of (name, value) pairs in field order
+        """
+        return (('latitude', self.latitude),
+                ('longitude', self.longitude),
+                ('lat_dir', self.lat_dir),
+                ('lon_dir', self.lon_dir),
+                ('height', self.height),
+                ('num_sats', self.num_sats),
+                ('gps_quality', self.gps_quality))
+
     def to_dict(self) -> dict:
         """Convert GPS data to dictionary for export."""
         return {
@@ -45,3 +75,39 @@ class GPSData:
             'num_sats': self.num_sats,
             'gps_quality': self.gps_quality
         }
+
+
+class SatelliteInfo(NamedTuple):
+    """
+    Satellite summary shown in the UI; fields are None when the GPS is not connected.
+
+    Attributes:
+        num_sats: Number of satellites in view
+        gps_quality: GPS fix quality (0=Invalid, 1=GPS, 2=DGPS)
+    """
+    num_sats: Optional[int] = None
+    gps_quality: Optional[int] = None
+
+
+class PositionInfo(NamedTuple):
+    """
+    Averaged position shown in the UI; fields are None when the GPS is not connected.
+
+    Attributes:
+        latitude: Mean latitude in decimal degrees
+        lat_err: Standard deviation of latitude
+        longitude: Mean longitude in decimal degrees
+        lon_err: Standard deviation of longitude
+        lat_dir: Latitude direction ('N' or 'S')
+        lon_dir: Longitude direction ('E' or 'W')
+        height: Mean height in meters
+        height_err: Standard deviation of height
+    """
+    latitude: Optional[float] = None
+    lat_err: Optional[float] = None
+    longitude: Optional[float] = None
+    lon_err: Optional[float] = None
+    lat_dir: Optional[str] = None
+    lon_dir: Optional[str] = None
+    height: Optional[float] = None
+    height_err: Optional[float] = None
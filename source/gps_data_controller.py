@@ -3,15 +3,21 @@ GPS Data Controller for managing GPS data updates and business logic.
 Separates controller concerns from view logic.
 """
 import logging
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable
 from gps_connection_manager import GPSConnectionManager
-from gps_data import GPSData
+from gps_data import GPSData, PositionInfo, SatelliteInfo
 from gps_statistics import GPSStatistics
 
 logger = logging.getLogger(__name__)
 
 gps_stats = GPSStatistics(100)
 
+# Status shown while a manual refresh runs; callers show it briefly
+REFRESHING_MESSAGE = "Refreshing GPS data..."
+
+_NO_SATELLITE_INFO = SatelliteInfo()
+_NO_POSITION_INFO = PositionInfo()
+
 
 class GPSDataController:
     """
@@ -30,6 +36,12 @@ class GPSDataController:
         """
         self.connection_manager = connection_manager
         self._last_error: Optional[str] = None
+        # Satellite view is rebuilt only when its source values change
+        self._satellite_info = _NO_SATELLITE_INFO
+        # data_version last reported by has_new_data
+        self._seen_version: tuple = (None, 0)
+        # data_version of the last snapshot added to the statistics window
+        self._sampled_version: tuple = (None, 0)
 
     @property
     def is_connected(self) -> bool:
@@ -43,65 +55,93 @@ class GPSDataController:
 
     def get_current_data(self) -> Optional[GPSData]:
         """
-        Get current GPS data without updating.
+        Get the latest GPS data snapshot published by the background reader.
 
         Returns:
-            Current GPSData object or None if not connected
+            Current GPSData snapshot or None if not connected
         """
-        gps = self.connection_manager.gps
-        if not gps:
+        reader = self.connection_manager.reader
+        if not reader:
             return None
-        return gps.data
+        return reader.latest
+
+    @property
+    def data_version(self) -> tuple:
+        """Get a token that changes whenever the reader publishes a snapshot or is replaced."""
+        reader = self.connection_manager.reader
+        return reader, reader.published if reader else 0
 
-    def get_satellite_info(self) -> Dict[str, Any]:
+    def has_new_data(self) -> bool:
         """
-        Get satellite information.
+        Check whether the reader has published a snapshot since the last call.
+
+        A new reader (after a reconnect) counts as new data once it has published;
+        until then its snapshot is only the GPS data it was started with.
 
         Returns:
-            Dictionary with num_sats and gps_quality, or None values if not connected
+            True if the data changed since the previous call, False otherwise
         """
-        gps = self.connection_manager.gps
-        if not gps:
-            return {'num_sats': None, 'gps_quality': None}
-        return {
-            'num_sats': gps.num_sats,
-            'gps_quality': gps.gps_quality
-        }
+        version = self.data_version
+        reader, published = version
+        if version == self._seen_version or (reader is not None and not published):
+            return False
+        self._seen_version = version
+        return True
 
-    def get_position_info(self) -> Dict[str, Any]:
+    def get_satellite_info(self) -> SatelliteInfo:
+        """
+        Get satellite information.
+
+        Returns:
+            SatelliteInfo with num_sats and gps_quality, or None values if not connected
+        """
+        data = self.get_current_data()
+        if not data:
+            return _NO_SATELLITE_INFO
+        info = self._satellite_info
+        if info.num_sats != data.num_sats or info.gps_quality != data.gps_quality:
+            info = self._satellite_info = SatelliteInfo(data.num_sats, data.gps_quality)
+        return info
+
+    def get_position_info(self) -> PositionInfo:
         """
         Get position information.
 
         Returns:
-            Dictionary with latitude, longitude, height and directions, or None values if not connected
-        """
-        gps = self.connection_manager.gps
-        if not gps:
-            return {
-                'latitude': None,
-                'longitude': None,
-                'lat_dir': None,
-                'lon_dir': None,
-                'height': None
-            }
-
-        gps_stats.add_data(gps.data)
+            PositionInfo with mean latitude, longitude, height, their errors and directions,
+            or None values if not connected
+        """
+        data = self.get_current_data()
+        if not data:
+            return _NO_POSITION_INFO
+
+        # Sample each published fix once; unpublished, invalid or altitude-less snapshots
+        # (empty GGA field) can't be averaged, so show the window as it stands
+        version = self.data_version
+        if (version != self._sampled_version and version[1] and data.is_valid()
+                and data.has_position() and data.height is not None):
+            gps_stats.add_data(data)
+            self._sampled_version = version
+        # Only the mean and spread are shown, so the median and mode are never computed
         mean = gps_stats.get_mean()
-
-        return {
-            'latitude': mean['latitude'],
-            'lat_err': gps_stats.get_stdev()['latitude'],
-            'longitude': mean['longitude'],
-            'lon_err': gps_stats.get_stdev()['longitude'],
-            'lat_dir': gps.lat_dir,
-            'lon_dir': gps.lon_dir,
-            'height': mean['height'],
-            'height_err': gps_stats.get_stdev()['height']
-        }
+        stdev = gps_stats.get_stdev()
+
+        return PositionInfo(
+            latitude=mean['latitude'],
+            lat_err=stdev['latitude'],
+            longitude=mean['longitude'],
+            lon_err=stdev['longitude'],
+            lat_dir=data.lat_dir,
+            lon_dir=data.lon_dir,
+            height=mean['height'],
+            height_err=stdev['height']
+        )
 
     def update_gps_data(self) -> bool:
         """
-        Read and update GPS data from device.
+        Check the background reader that keeps GPS data up to date.
+
+        Serial reads happen on the reader thread; this only surfaces a failed read.
 
         Returns:
             True if update successful, False otherwise
@@ -111,20 +151,18 @@ class GPSDataController:
         """
         self._last_error = None
 
-        gps = self.connection_manager.gps
-        if not gps:
+        reader = self.connection_manager.reader
+        if not reader:
             self._last_error = "The GPS Module is not connected."
             return False
 
-        try:
-            gps.read_gps_data()
-            return True
-        except RuntimeError as e:
-            self._last_error = f"GPS Error: {e}"
-            logger.error(f"GPS read error: {e}")
+        if reader.error:
+            self._last_error = f"GPS Error: {reader.error}"
+            logger.error("GPS read error: %s", reader.error)
             # Disconnect on read error to trigger reconnection
             self.connection_manager.disconnect()
             return False
+        return True
 
     def manual_refresh(self, status_callback: Optional[Callable[[str], None]] = None) -> bool:
         """
@@ -138,7 +176,7 @@ class GPSDataController:
         """
         if self.connection_manager.is_connected:
             if status_callback:
-                status_callback("Refreshing GPS data...")
+                status_callback(REFRESHING_MESSAGE)
             return self.update_gps_data()
         else:
             if status_callback:
@@ -152,12 +190,11 @@ class GPSDataController:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        gps = self.connection_manager.gps
-        if not gps:
+        data = self.get_current_data()
+        if not data:
             return False, "No GPS data available to export."
 
-        data = gps.data
-        if not data or not data.has_position():
+        if not data.has_position():
             return False, "GPS data is not valid or has no position information."
 
         return True, None
@@ -2,21 +2,32 @@
 GPS Data Exporter for exporting GPS data to various formats.
 Supports CSV export with extensibility for other formats.
 """
+import csv
+import io
 import logging
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Iterable, Optional
 
 from gps_data import GPSData
 
 logger = logging.getLogger(__name__)
 
+CSV_HEADER = "Timestamp,Latitude,Longitude,Height (m),Satellites,GPS Quality\n"
+_CSV_HEADER_BYTES = CSV_HEADER.encode('ascii')
+GPS_QUALITY_NAMES = {0: "Invalid", 1: "GPS", 2: "DGPS"}
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+_FILENAME_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+# GPSData fields written after the timestamp column, in column order
+_ROW_FIELDS = attrgetter('latitude', 'longitude', 'height', 'num_sats', 'gps_quality')
+
 
 class DataExporter(ABC):
     """Abstract base class for GPS data exporters."""
 
     @abstractmethod
-    def export(self, gps_data: GPSData, filename: str) -> bool:
+    def export(self, gps_data: GPSData, filename: str) -> None:
         """
         Export GPS data to file.
 
@@ -24,8 +35,8 @@ class DataExporter(ABC):
             gps_data: GPS data to export
             filename: Output filename
 
-        Returns:
-            True if export successful, False otherwise
+        Raises:
+            OSError: If the file cannot be written
         """
         pass
 
@@ -38,7 +49,7 @@ class DataExporter(ABC):
 class CSVExporter(DataExporter):
     """Export GPS data to CSV format."""
 
-    def export(self, gps_data: GPSData, filename: str) -> bool:
+    def export(self, gps_data: GPSData, filename: str) -> None:
         """
         Export GPS data to CSV file.
 
@@ -46,27 +57,42 @@ class CSVExporter(DataExporter):
             gps_data: GPS data to export
             filename: Output filename
 
-        Returns:
-            True if export successful, False otherwise
+        Raises:
+            OSError: If the file cannot be written
         """
-        try:
-            with open(filename, 'w') as f:
-                # Write header
-                f.write("Timestamp,Latitude,Longitude,Height (m),Satellites,GPS Quality\n")
+        self.export_many((gps_data,), filename)
 
-                # Write GPS data
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                quality_map = {0: "Invalid", 1: "GPS", 2: "DGPS"}
-                quality_str = quality_map.get(gps_data.gps_quality, "Unknown")
+    def export_many(self, samples: Iterable[GPSData], filename: str) -> None:
+        """
+        Export a series of GPS samples to a CSV file, one row per sample.
 
-                f.write(f"{timestamp},{gps_data.latitude},{gps_data.longitude},"
-                        f"{gps_data.height},{gps_data.num_sats},{quality_str}\n")
+        Rows are built by a Python generator and handed to csv.writer.writerows in
+        one call; the rendered text is encoded once and written to a binary file
+        after the pre-encoded header. Every row carries the export timestamp.
 
-            logger.info(f"GPS data exported to {filename}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to export GPS data: {e}")
-            return False
+        Only export() calls this today, with a single sample; the series form is
+        kept for logging a window of fixes to one file.
+
+        Args:
+            samples: GPS data samples to export, in row order
+            filename: Output filename
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        timestamp = time.strftime(_TIMESTAMP_FORMAT)
+        quality_name = GPS_QUALITY_NAMES.get
+        rows = ((timestamp, latitude, longitude, height, num_sats, quality_name(quality, "Unknown"))
+                for latitude, longitude, height, num_sats, quality in map(_ROW_FIELDS, samples))
+
+        text = io.StringIO()
+        csv.writer(text, lineterminator='\n').writerows(rows)
+
+        with open(filename, 'wb') as f:
+            f.write(_CSV_HEADER_BYTES)
+            f.write(text.getvalue().encode('ascii'))
+
+        logger.info("GPS data exported to %s", filename)
 
     def get_file_extension(self) -> str:
         """Get the file extension for CSV files."""
@@ -105,11 +131,8 @@ class GPSDataExporter:
             return False, "No GPS position data available to export"
 
         try:
-            success = self.exporter.export(gps_data, filename)
-            if success:
-                return True, None
-            else:
-                return False, "Export failed (see logs for details)"
+            self.exporter.export(gps_data, filename)
+            return True, None
         except Exception as e:
             error_msg = f"Failed to export data: {e}"
             logger.error(error_msg)
@@ -122,7 +145,7 @@ class GPSDataExporter:
         Returns:
             Default filename string
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = time.strftime(_FILENAME_TIMESTAMP_FORMAT)
         extension = self.exporter.get_file_extension()
         return f"gps_data_{timestamp}{extension}"
 
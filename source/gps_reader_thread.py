@@ -0,0 +1,114 @@
+"""
+Background reader thread for GPS serial I/O.
+Keeps serial reads and NMEA parsing off the Qt GUI thread.
+"""
+import logging
+from copy import copy
+from typing import Optional
+
+from PyQt5 import QtCore
+
+from gps import GT_U7GPS
+from gps_data import GPSData
+
+logger = logging.getLogger(__name__)
+
+# Pause after each drain: batches the bytes of a sentence burst and rate-limits publishing
+DEFAULT_READ_INTERVAL_MS = 50
+# Upper bound on drains merged into one publish, so a line that never goes quiet still updates
+MAX_DRAINS_PER_PUBLISH = 10
+
+
+class GPSReaderThread(QtCore.QThread):
+    """
+    Reads and parses GPS data on a background thread.
+
+    The thread owns all reads from the GPS instance. It blocks on the serial port
+    until bytes arrive rather than polling, then keeps draining while the rest of
+    the sentence burst trickles in, and publishes one snapshot of the parsed data
+    per burst. Only the latest snapshot is kept: readers
+    on the GUI thread pick it up through a single reference swap, so no lock is
+    needed and a slow UI never makes the reader fall behind.
+
+    Each publish also emits `snapshot_ready`, and a failed read emits `read_failed`.
+    Receivers on the GUI thread get these as queued calls, so they can update widgets
+    directly without polling.
+
+    Every publish is a fresh copy that the reader never writes to again, so a
+    snapshot handed to another thread can be read at any later time without
+    ever seeing a half-parsed update. That is one small allocation per burst.
+    """
+
+    # Emitted from the reader thread with the newly published GPSData snapshot
+    snapshot_ready = QtCore.pyqtSignal(object)
+    # Emitted from the reader thread with the error message when a read fails
+    read_failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, gps: GT_U7GPS, read_interval_ms: int = DEFAULT_READ_INTERVAL_MS):
+        """
+        Initialize the reader thread.
+
+        Args:
+            gps: GPS instance to read from (must not be read by any other thread)
+            read_interval_ms: Pause between drains in milliseconds
+        """
+        super().__init__()
+        self._gps = gps
+        self._read_interval_ms = read_interval_ms
+        self._latest: GPSData = copy(gps.data)
+        self._error: Optional[str] = None
+        self._published = 0
+
+    @property
+    def latest(self) -> GPSData:
+        """Get the most recent GPS data snapshot."""
+        return self._latest
+
+    @property
+    def published(self) -> int:
+        """Get the number of snapshots published so far; it changes whenever `latest` does."""
+        return self._published
+
+    @property
+    def error(self) -> Optional[str]:
+        """Get the read error that stopped the thread, if any."""
+        return self._error
+
+    def run(self):
+        """Wait for serial data, drain it and publish snapshots until stopped or a read fails."""
+        # Bound once: this loop runs for the life of the connection
+        interruption_requested = self.isInterruptionRequested
+        read_gps_data = self._gps.read_gps_data
+        parsed = self._gps.data
+        msleep = self.msleep
+        emit_snapshot = self.snapshot_ready.emit
+        read_interval_ms = self._read_interval_ms
+        while not interruption_requested():
+            try:
+                received = read_gps_data(wait=True)
+                # At 9600 baud a fix's sentences arrive over a few hundred milliseconds:
+                # keep draining until the line goes quiet so the burst is published once
+                drains = 1
+                while received and drains < MAX_DRAINS_PER_PUBLISH and not interruption_requested():
+                    msleep(read_interval_ms)
+                    if not read_gps_data():
+                        break
+                    drains += 1
+            except RuntimeError as e:
+                logger.error("GPS reader stopped: %s", e)
+                self._error = str(e)
+                self.read_failed.emit(self._error)
+                return
+            if received:
+                # Publish with a single reference swap; the snapshot is never written again
+                snapshot = copy(parsed)
+                self._latest = snapshot
+                self._published += 1
+                emit_snapshot(snapshot)
+            msleep(read_interval_ms)
+
+    def stop(self):
+        """Stop the thread, waking it if it is blocked waiting for data."""
+        self.requestInterruption()
+        self._gps.cancel_read()
+        self.wait()
@@ -2,11 +2,58 @@
 Statistical analysis for GPS data with rolling window support.
 """
 import logging
-from collections import deque
-from statistics import mean, median, mode, stdev, StatisticsError
-from typing import Optional
+from bisect import bisect_left, insort
+from collections import Counter, deque
+from math import fsum, sqrt
+from operator import attrgetter
+from typing import Iterable, List, Optional, Sequence
 from gps_data import GPSData
 
+logger = logging.getLogger(__name__)
+
+# Fields tracked by the statistics, read from a GPSData in one call
+_SAMPLE_FIELDS = attrgetter('latitude', 'longitude', 'height')
+
+
+def _discard_sorted(ordered: List[float], value: float) -> None:
+    """Remove one occurrence of value from a sorted list."""
+    i = bisect_left(ordered, value)
+    if i < len(ordered) and ordered[i] == value:
+        del ordered[i]
+    else:
+        # Unordered values such as NaN can't be bisected; remove() matches by identity first
+        ordered.remove(value)
+
+
+def _mode(values: Iterable[float]) -> Optional[float]:
+    """Get the most common value, or None if there is no unique one."""
+    top = Counter(values).most_common(2)
+    if len(top) == 1 or top[0][1] > top[1][1]:
+        return top[0][0]
+    return None
+
+
+def _stdev(values: Sequence[float]) -> float:
+    """
+    Get the sample standard deviation of at least two values.
+
+    Two-pass float computation with exactly rounded sums: accurate for GPS-scale
+    data and several times faster than statistics.stdev, which works in exact
+    fractions. Values are measured from the first one, so a constant window gives
+    exactly 0.0 rather than the rounding error of its mean.
+    """
+    origin = values[0]
+    offsets = [x - origin for x in values]
+    mean = fsum(offsets) / len(offsets)
+    return sqrt(fsum([(x - mean) ** 2 for x in offsets]) / (len(offsets) - 1))
+
+
+def _median(ordered: List[float]) -> float:
+    """Get the median of a non-empty sorted list."""
+    n = len(ordered)
+    middle = n // 2
+    return ordered[middle] if n % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
 
 class GPSStatistics:
     """
@@ -22,7 +69,20 @@ class GPSStatistics:
         Args:
             N: Maximum number of GPSData objects to store (default: 10)
         """
-        self._data: deque = deque(maxlen=N)
+        # One window per field (struct of arrays): no GPSData copies, no per-query list building
+        self._lat: deque = deque(maxlen=N)
+        self._lon: deque = deque(maxlen=N)
+        self._h: deque = deque(maxlen=N)
+        # Running sums give an O(1) mean; they are re-summed exactly once per window turnover
+        # so rounding error from the add/subtract updates cannot build up
+        self._sum_lat = 0.0
+        self._sum_lon = 0.0
+        self._sum_h = 0.0
+        self._adds_since_resum = 0
+        # Each window kept in sorted order as well, so the median is a lookup rather than a sort
+        self._lat_sorted: List[float] = []
+        self._lon_sorted: List[float] = []
+        self._h_sorted: List[float] = []
 
     def add_data(self, gps_data: GPSData) -> None:
         """
@@ -31,48 +91,67 @@ class GPSStatistics:
         Args:
             gps_data: GPSData instance to add
         """
-        from copy import deepcopy
-        self._data.append(deepcopy(gps_data))
-        logging.info(f"appending {gps_data.latitude}")
+        latitude, longitude, height = _SAMPLE_FIELDS(gps_data)
+        lat, lon, h = self._lat, self._lon, self._h
+        if len(lat) == lat.maxlen:
+            # Full window: the append below evicts the oldest sample
+            self._sum_lat -= lat[0]
+            self._sum_lon -= lon[0]
+            self._sum_h -= h[0]
+            _discard_sorted(self._lat_sorted, lat[0])
+            _discard_sorted(self._lon_sorted, lon[0])
+            _discard_sorted(self._h_sorted, h[0])
+        lat.append(latitude)
+        lon.append(longitude)
+        h.append(height)
+        self._sum_lat += latitude
+        self._sum_lon += longitude
+        self._sum_h += height
+        insort(self._lat_sorted, latitude)
+        insort(self._lon_sorted, longitude)
+        insort(self._h_sorted, height)
+
+        self._adds_since_resum += 1
+        if self._adds_since_resum == lat.maxlen:
+            self._adds_since_resum = 0
+            self._sum_lat, self._sum_lon, self._sum_h = fsum(lat), fsum(lon), fsum(h)
+        logger.debug("appending %s", latitude)
 
     def get_mean(self) -> dict:
         """
         Calculate the arithmetic mean for latitude, longitude, and height.
 
+        Uses running sums, so the cost does not depend on the window size.
+
         Returns:
             Dictionary with mean values for each field, or None if empty
         """
-        if not self._data:
+        n = len(self._lat)
+        if not n:
             return {'latitude': None, 'longitude': None, 'height': None}
 
-        latitudes = [d.latitude for d in self._data]
-        longitudes = [d.longitude for d in self._data]
-        heights = [d.height for d in self._data]
-
         return {
-            'latitude': mean(latitudes),
-            'longitude': mean(longitudes),
-            'height': mean(heights)
+            'latitude': self._sum_lat / n,
+            'longitude': self._sum_lon / n,
+            'height': self._sum_h / n
         }
 
     def get_median(self) -> dict:
         """
         Calculate the median for latitude, longitude, and height.
 
+        Reads the middle of the sorted windows, so no sorting happens per call.
+
         Returns:
             Dictionary with median values for each field, or None if empty
         """
-        if not self._data:
+        if not self._lat:
             return {'latitude': None, 'longitude': None, 'height': None}
 
-        latitudes = [d.latitude for d in self._data]
-        longitudes = [d.longitude for d in self._data]
-        heights = [d.height for d in self._data]
-
         return {
-            'latitude': median(latitudes),
-            'longitude': median(longitudes),
-            'height': median(heights)
+            'latitude': _median(self._lat_sorted),
+            'longitude': _median(self._lon_sorted),
+            'height': _median(self._h_sorted)
         }
 
     def get_mode(self) -> dict:
@@ -84,34 +163,14 @@ class GPSStatistics:
         Returns:
             Dictionary with mode values for each field, or None if empty/no unique mode
         """
-        if not self._data:
+        if not self._lat:
             return {'latitude': None, 'longitude': None, 'height': None}
 
-        latitudes = [d.latitude for d in self._data]
-        longitudes = [d.longitude for d in self._data]
-        heights = [d.height for d in self._data]
-
-        result = {}
-
-        # Calculate mode for latitude
-        try:
-            result['latitude'] = mode(latitudes)
-        except StatisticsError:
-            result['latitude'] = None
-
-        # Calculate mode for longitude
-        try:
-            result['longitude'] = mode(longitudes)
-        except StatisticsError:
-            result['longitude'] = None
-
-        # Calculate mode for height
-        try:
-            result['height'] = mode(heights)
-        except StatisticsError:
-            result['height'] = None
-
-        return result
+        return {
+            'latitude': _mode(self._lat),
+            'longitude': _mode(self._lon),
+            'height': _mode(self._h)
+        }
 
     def get_stdev(self) -> dict:
         """
@@ -120,15 +179,12 @@ class GPSStatistics:
         Returns:
             Dictionary with standard deviation values for each field, or None if empty/insufficient data
         """
-        if not self._data or len(self._data) < 2:
+        if len(self._lat) < 2:
             return {'latitude': None, 'longitude': None, 'height': None}
 
-        latitudes = [d.latitude for d in self._data]
-        longitudes = [d.longitude for d in self._data]
-        heights = [d.height for d in self._data]
-        dlat = stdev(latitudes);
-        dlon = stdev(longitudes)
-        dh = stdev(heights)
+        dlat = _stdev(self._lat)
+        dlon = _stdev(self._lon)
+        dh = _stdev(self._h)
 
         return {
             'latitude': dlat,
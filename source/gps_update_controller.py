@@ -44,11 +44,16 @@ class GPSUpdateController:
         self.timer.setInterval(self.update_interval)
         self.timer.timeout.connect(self._on_timer_tick)
 
+        # One reusable timer for reconnection attempts instead of a new singleShot per request
+        self._reconnect_timer = QtCore.QTimer()
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self.reconnect_callback)
+
     def start(self):
         """Start the update timer."""
         if not self.timer.isActive():
             self.timer.start()
-            logger.info(f"GPS update controller started with {self.update_interval}ms interval")
+            logger.info("GPS update controller started with %sms interval", self.update_interval)
 
     def stop(self):
         """Stop the update timer."""
@@ -73,7 +78,7 @@ class GPSUpdateController:
         self.timer.setInterval(interval_ms)
         if was_running:
             self.timer.start()
-        logger.info(f"Update interval changed to {interval_ms}ms")
+        logger.info("Update interval changed to %sms", interval_ms)
 
     def set_reconnect_interval(self, interval_ms: int):
         """
@@ -83,12 +88,20 @@ class GPSUpdateController:
             interval_ms: New reconnection interval in milliseconds
         """
         self.reconnect_interval = interval_ms
-        logger.info(f"Reconnect interval changed to {interval_ms}ms")
+        logger.info("Reconnect interval changed to %sms", interval_ms)
 
     def schedule_reconnect(self):
-        """Schedule a reconnection attempt after reconnect_interval."""
-        QtCore.QTimer.singleShot(self.reconnect_interval, self.reconnect_callback)
-        logger.debug(f"Reconnection scheduled in {self.reconnect_interval}ms")
+        """
+        Schedule a reconnection attempt after reconnect_interval.
+
+        While an attempt is already pending, further requests are ignored: the update
+        tick keeps asking while disconnected, and restarting the timer would push the
+        attempt back indefinitely.
+        """
+        if self._reconnect_timer.isActive():
+            return
+        self._reconnect_timer.start(self.reconnect_interval)
+        logger.debug("Reconnection scheduled in %sms", self.reconnect_interval)
 
     def _on_timer_tick(self):
         """Internal timer callback - delegates to update callback."""
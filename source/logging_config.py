@@ -26,7 +26,7 @@ def configure_logging(level=logging.INFO, log_format=None):
     )
 
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured at level: {logging.getLevelName(level)}")
+    logger.info("Logging configured at level: %s", logging.getLevelName(level))
     return logger
 
 
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from PyQt5 import QtCore
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStatusBar, QLineEdit, QPushButton, QLabel
@@ -17,8 +19,12 @@ from gps_data_exporter import GPSDataExporter
 from gps_update_controller import GPSUpdateController
 from panel_factory import PanelFactory
 from settings_mediator import SettingsMediator
+from throttle import Throttled
 from view_update_coordinator import ViewUpdateCoordinator
 
+# Shortest time between view refreshes driven by reader snapshots
+VIEW_REFRESH_THROTTLE_MS = 50
+
 
 class MainWindow(QMainWindow):
     def __init__(self, config: AppConfig = None, gps_instance: GT_U7GPS = None):
@@ -31,12 +37,20 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
         self.config = config or DEFAULT_CONFIG
+        # Created in init_view; the connection manager may report status before then
+        self.status_bar: Optional[QStatusBar] = None
+        self.view_coordinator: Optional[ViewUpdateCoordinator] = None
+        self._export_action: Optional[ExportAction] = None
+        # Back-to-back snapshots refresh the views once straight away and once more when the burst ends
+        self._refresh_on_data = Throttled(self._refresh_views, VIEW_REFRESH_THROTTLE_MS, self)
 
         # Initialize managers and controllers
         self.connection_manager = GPSConnectionManager(
             port=self.config.gps_port,
             baudrate=self.config.baudrate,
-            status_callback=self._update_status_bar
+            status_callback=self._update_status_bar,
+            data_callback=self._on_gps_data,
+            error_callback=self._on_gps_read_error
         )
         self.data_controller = GPSDataController(self.connection_manager)
         self.data_exporter = GPSDataExporter()
@@ -44,8 +58,8 @@ class MainWindow(QMainWindow):
         self.update_controller = GPSUpdateController(
             update_interval_ms=self.config.gps_update_interval_ms,
             reconnect_interval_ms=self.config.gps_reconnect_interval_ms,
-            update_callback=self.update_gps_data,
-            reconnect_callback=self.connection_manager.reconnect
+            update_callback=self._on_update_tick,
+            reconnect_callback=self.connection_manager.reconnect_async
         )
 
         # Initialize mediators and coordinators
@@ -84,13 +98,14 @@ class MainWindow(QMainWindow):
 
     def _update_status_bar(self, message: str):
         """Callback for connection manager status updates."""
-        if hasattr(self, 'status_bar'):
+        if self.status_bar is not None:
             self.status_bar.showMessage(message)
 
     # View helpers
     def _status_message(self, message: str, duration: int = 2000):
         """Helper to show status bar message."""
-        self.status_bar.showMessage(message, duration)
+        if self.status_bar is not None:
+            self.status_bar.showMessage(message, duration)
 
     def _create_quick_actions_panel(self) -> QWidget:
         """
@@ -141,7 +156,7 @@ class MainWindow(QMainWindow):
         self.meshtastic_command_field.setReadOnly(True)
 
         # Set command field updater in view coordinator
-        if hasattr(self, 'view_coordinator'):
+        if self.view_coordinator is not None:
             self.view_coordinator.command_field_updater = self.meshtastic_command_field.setText
 
         copy_button = QPushButton("Copy")
@@ -212,13 +227,15 @@ class MainWindow(QMainWindow):
 
     def export_data(self):
         """Export current GPS data to CSV file."""
-        action = ExportAction(
-            data_controller=self.data_controller,
-            data_exporter=self.data_exporter,
-            parent_widget=self,
-            status_callback=self._status_message
-        )
-        action.execute()
+        # Kept across exports so its file dialog and message box are reused
+        if self._export_action is None:
+            self._export_action = ExportAction(
+                data_controller=self.data_controller,
+                data_exporter=self.data_exporter,
+                parent_widget=self,
+                status_callback=self._status_message
+            )
+        self._export_action.execute()
 
     def open_settings(self):
         """Open settings dialog."""
@@ -230,8 +247,30 @@ class MainWindow(QMainWindow):
         action.execute()
 
     # Controller
-    def update_gps_data(self):
-        """Update GPS data and refresh UI - called by update controller."""
+    def _on_update_tick(self):
+        """Update controller tick: supervise the connection; new data arrives through the reader's signals."""
+        self.update_gps_data(force_refresh=False)
+
+    def _on_gps_data(self, _snapshot):
+        """Reader published a snapshot: refresh the views (queued to the GUI thread)."""
+        self._refresh_on_data()
+
+    def _refresh_views(self):
+        """Refresh the views if the reader has published anything since the last refresh."""
+        if self.view_coordinator is not None and self.data_controller.has_new_data():
+            self.view_coordinator.update_all()
+
+    def _on_gps_read_error(self, _message: str):
+        """Reader failed: report it and schedule a reconnect without waiting for the next tick."""
+        self.update_gps_data(force_refresh=False)
+
+    def update_gps_data(self, force_refresh: bool = True):
+        """
+        Update GPS data and refresh UI.
+
+        Args:
+            force_refresh: Refresh the views even if no new GPS data has arrived
+        """
         if not self.data_controller.is_connected:
             if not self.settings_mediator.is_reconnecting():
                 self.update_controller.schedule_reconnect()
@@ -241,8 +280,9 @@ class MainWindow(QMainWindow):
         success = self.data_controller.update_gps_data()
 
         if success:
-            # Use coordinator for all view updates
-            self.view_coordinator.update_all()
+            # Ticks between GPS fixes have nothing to show; skip the panel, stats and command work
+            if self.view_coordinator is not None and (self.data_controller.has_new_data() or force_refresh):
+                self.view_coordinator.update_all()
         else:
             error_msg = self.data_controller.last_error
             self._status_message(error_msg)
@@ -3,6 +3,10 @@ NMEA sentence parser for extracting GPS data.
 Handles parsing and processing of NMEA 0183 protocol messages.
 """
 import logging
+import re
+from functools import reduce
+from operator import xor
+from typing import Any, Callable, Dict, Tuple
 
 import pynmea2
 
@@ -12,6 +16,63 @@ logger = logging.getLogger(__name__)
 
 NMEA_GPS_PREFIX = '$GP'
 
+# Sentence types carrying fields GPSData uses (own-ship position, altitude, satellites, fix
+# quality); everything else (GSV, GSA, VTG, ...) is skipped before reaching pynmea2
+USED_SENTENCE_TYPES = frozenset(('GGA', 'RMC', 'GLL', 'GNS'))
+
+# One used GPS sentence: prefix and type up to the next whitespace (NMEA fields never contain any)
+_GPS_SENTENCE_RE = re.compile(re.escape(NMEA_GPS_PREFIX) + '(?:' + '|'.join(sorted(USED_SENTENCE_TYPES)) + r')\S*')
+_TYPE_SLICE = slice(len(NMEA_GPS_PREFIX), len(NMEA_GPS_PREFIX) + 3)
+
+
+def _split_fields(sentence: str, verify_checksum: bool = True) -> list:
+    """
+    Split an NMEA sentence into its comma-separated fields, checking the checksum if present.
+
+    Args:
+        sentence: Sentence starting with '$'
+        verify_checksum: False to drop the checksum without checking it
+
+    Returns:
+        Fields of the sentence body; the first is the talker and sentence type
+
+    Raises:
+        ValueError: If the checksum is malformed or does not match
+    """
+    star = sentence.find('*')
+    if star < 0:
+        return sentence[1:].rstrip().split(',')
+    body = sentence[1:star]
+    if not verify_checksum:
+        return body.split(',')
+    checksum = sentence[star + 1:].rstrip()
+    if len(checksum) != 2 or int(checksum, 16) != reduce(xor, body.encode('ascii'), 0):
+        raise ValueError(f"checksum does not match: {checksum}")
+    return body.split(',')
+
+
+def _coordinate(dm: str, direction: str, positive: str, negative: str) -> float:
+    """
+    Convert a DDDMM.MMMM coordinate and its direction to signed decimal degrees.
+
+    Matches pynmea2: an empty value or an unknown direction gives 0.0.
+
+    Raises:
+        ValueError: If the coordinate is not in DDDMM.MMMM form
+    """
+    if direction == positive:
+        sign = 1.0
+    elif direction == negative:
+        sign = -1.0
+    else:
+        return 0.0
+    if not dm or dm == '0':
+        return 0.0
+    dot = dm.find('.')
+    if dot < 3:
+        raise ValueError(f"Geographic coordinate value '{dm}' is not valid DDDMM.MMM")
+    return sign * (float(dm[:dot - 2]) + float(dm[dot - 2:]) / 60)
+
 
 class NMEAParser:
     """
@@ -29,58 +90,165 @@ class NMEAParser:
             gps_data: GPSData object to update with parsed information
         """
         self._data = gps_data
+        # Sentence types decoded by hand; the remaining used types go through pynmea2
+        self._fast_parsers = {'GGA': self._apply_gga, 'RMC': self._apply_rmc, 'GLL': self._apply_gll}
+        # Processors that apply to each pynmea2 message class, worked out from its first message
+        self._fallback_processors: Dict[type, Tuple[Callable[[Any], None], ...]] = {}
 
-    def parse_sentence(self, nmea_sentence: str) -> bool:
+    def parse_sentence(self, nmea_sentence: str, verify_checksum: bool = True) -> bool:
         """
         Parse a single NMEA sentence and update GPS data.
 
+        Sentence types outside USED_SENTENCE_TYPES are ignored without being parsed.
+        GGA, RMC and GLL, which make up nearly all traffic, are split and converted
+        directly; other used types fall back to pynmea2.
+
         Args:
             nmea_sentence: Raw NMEA sentence string
+            verify_checksum: False if the caller has already verified the checksum;
+                skips the check for the hand-decoded types (pynmea2 always checks)
 
         Returns:
-            True if sentence was parsed successfully, False otherwise
+            True if sentence was parsed successfully, False if it was invalid or ignored
         """
-        if not nmea_sentence or not nmea_sentence.startswith(NMEA_GPS_PREFIX):
+        if (not nmea_sentence or not nmea_sentence.startswith(NMEA_GPS_PREFIX)
+                or nmea_sentence[_TYPE_SLICE] not in USED_SENTENCE_TYPES):
             return False
 
+        # One level check per sentence instead of one per debug call
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            logger.debug(f"NMEA: {nmea_sentence}")
-            msg = pynmea2.parse(nmea_sentence)
-
-            if hasattr(msg, 'timestamp'):
-                logger.debug(f"Timestamp: {msg.timestamp}")
-
-            self._process_position(msg)
-            self._process_altitude(msg)
-            self._process_satellites(msg)
-            logger.debug("-" * 20)
+            if debug:
+                logger.debug("NMEA: %s", nmea_sentence)
+            apply = self._fast_parsers.get(nmea_sentence[_TYPE_SLICE])
+            if apply is not None:
+                apply(_split_fields(nmea_sentence, verify_checksum))
+            else:
+                msg = pynmea2.parse(nmea_sentence)
+
+                if debug and hasattr(msg, 'timestamp'):
+                    logger.debug("Timestamp: %s", msg.timestamp)
+
+                for process in self._processors_for(msg):
+                    process(msg)
+            if debug:
+                logger.debug("-" * 20)
             return True
 
-        except pynmea2.ParseError as e:
-            logger.error(f"Error parsing NMEA: {e}")
+        # pynmea2.ParseError is a ValueError, as are malformed fields in either path
+        except ValueError as e:
+            logger.error("Error parsing NMEA: %s", e)
             return False
 
+    def parse_buffer(self, text: str, verify_checksum: bool = True) -> int:
+        """
+        Parse every GPS sentence in a block of received text.
+
+        Sentences are located with a single regex scan, so non-GPS lines, unused
+        sentence types and line noise are skipped without a per-line Python dispatch.
+        Hand-decoded types go straight to their decoder rather than through parse_sentence.
+
+        Args:
+            text: Decoded serial data holding zero or more NMEA sentences
+            verify_checksum: False if the caller has already verified the checksums
+
+        Returns:
+            Number of sentences parsed successfully
+        """
+        matches = _GPS_SENTENCE_RE.finditer(text)
+        if logger.isEnabledFor(logging.DEBUG):
+            return sum(self.parse_sentence(match.group(), verify_checksum) for match in matches)
+
+        # Every match is a used GPS sentence, so parse_sentence's checks can be skipped and
+        # the hand-decoded types dispatched directly; other types still go through it
+        fast_parser = self._fast_parsers.get
+        parse_sentence = self.parse_sentence
+        parsed = 0
+        for match in matches:
+            sentence = match.group()
+            apply = fast_parser(sentence[_TYPE_SLICE])
+            if apply is None:
+                parsed += parse_sentence(sentence, verify_checksum)
+                continue
+            try:
+                apply(_split_fields(sentence, verify_checksum))
+                parsed += 1
+            except ValueError as e:
+                logger.error("Error parsing NMEA: %s", e)
+        return parsed
+
+    def _apply_gga(self, fields: list):
+        """Apply a GGA sentence: position, fix quality, satellite count and altitude."""
+        if len(fields) < 10:
+            raise ValueError(f"GGA sentence has {len(fields)} fields")
+        # Convert everything before assigning, so a bad field leaves the data untouched
+        latitude = _coordinate(fields[2], fields[3], 'N', 'S')
+        longitude = _coordinate(fields[4], fields[5], 'E', 'W')
+        gps_quality = int(fields[6])
+        num_sats = int(fields[7])
+        height = float(fields[9]) if fields[9] else None
+        data = self._data
+        data.latitude, data.lat_dir, data.longitude, data.lon_dir = latitude, fields[3], longitude, fields[5]
+        data.gps_quality = gps_quality
+        data.num_sats = num_sats
+        data.height = height
+
+    def _apply_rmc(self, fields: list):
+        """Apply the position from an RMC sentence."""
+        if len(fields) < 7:
+            raise ValueError(f"RMC sentence has {len(fields)} fields")
+        self._set_position(fields[3], fields[4], fields[5], fields[6])
+
+    def _apply_gll(self, fields: list):
+        """Apply the position from a GLL sentence."""
+        if len(fields) < 5:
+            raise ValueError(f"GLL sentence has {len(fields)} fields")
+        self._set_position(fields[1], fields[2], fields[3], fields[4])
+
+    def _set_position(self, lat: str, lat_dir: str, lon: str, lon_dir: str):
+        """Store a position given as NMEA coordinate fields."""
+        latitude = _coordinate(lat, lat_dir, 'N', 'S')
+        longitude = _coordinate(lon, lon_dir, 'E', 'W')
+        data = self._data
+        data.latitude, data.lat_dir, data.longitude, data.lon_dir = latitude, lat_dir, longitude, lon_dir
+
+    def _processors_for(self, msg) -> tuple:
+        """
+        Get the processors that apply to a pynmea2 message.
+
+        A message class always has the same fields, so the attribute checks run once
+        per class and later messages of that class go straight to their processors.
+        """
+        processors = self._fallback_processors.get(type(msg))
+        if processors is None:
+            processors = tuple(process for attribute, process in (
+                ('latitude', self._process_position),
+                ('altitude', self._process_altitude),
+                ('num_sats', self._process_num_sats),
+                ('gps_qual', self._process_gps_quality),
+            ) if hasattr(msg, attribute))
+            self._fallback_processors[type(msg)] = processors
+        return processors
+
     def _process_position(self, msg):
         """Extract position data from NMEA message."""
-        if hasattr(msg, 'latitude') and hasattr(msg, 'longitude'):
-            self._data.latitude = msg.latitude
-            self._data.longitude = msg.longitude
-            self._data.lat_dir = msg.lat_dir
-            self._data.lon_dir = msg.lon_dir
-            logger.debug(f"Latitude: {msg.latitude}° {msg.lat_dir}")
-            logger.debug(f"Longitude: {msg.longitude}° {msg.lon_dir}")
+        data = self._data
+        data.latitude, data.lat_dir, data.longitude, data.lon_dir = msg.latitude, msg.lat_dir, msg.longitude, msg.lon_dir
+        logger.debug("Latitude: %s° %s", msg.latitude, msg.lat_dir)
+        logger.debug("Longitude: %s° %s", msg.longitude, msg.lon_dir)
 
     def _process_altitude(self, msg):
         """Extract altitude data from NMEA message."""
-        if hasattr(msg, 'altitude'):
-            self._data.height = msg.altitude
-            logger.debug(f"Altitude: {msg.altitude} {msg.altitude_units}")
-
-    def _process_satellites(self, msg):
-        """Extract satellite count and GPS quality from NMEA message."""
-        if hasattr(msg, 'num_sats'):
-            self._data.num_sats = int(msg.num_sats)
-            #logger.info(f"Satellites: {msg.num_sats}")
-        if hasattr(msg, 'gps_qual'):
-            self._data.gps_quality = int(msg.gps_qual)
-            logger.debug(f"GPS Quality: {msg.gps_qual}")
+        # pynmea2 leaves some altitude fields (GNS) as text, empty when there is no fix
+        altitude = msg.altitude
+        self._data.height = None if altitude is None or altitude == '' else float(altitude)
+        logger.debug("Altitude: %s", msg.altitude)
+
+    def _process_num_sats(self, msg):
+        """Extract satellite count from NMEA message."""
+        self._data.num_sats = int(msg.num_sats)
+
+    def _process_gps_quality(self, msg):
+        """Extract GPS quality from NMEA message."""
+        self._data.gps_quality = int(msg.gps_qual)
+        logger.debug("GPS Quality: %s", msg.gps_qual)
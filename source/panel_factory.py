@@ -1,7 +1,7 @@
 """
 Panel factory for creating and managing GPS UI panels.
 """
-from typing import Dict, List, Tuple
+from typing import ClassVar, Dict, List, Tuple, Type
 from PyQt5.QtWidgets import QWidget, QGridLayout
 
 from Panels.position_panel import PositionPanel
@@ -22,14 +22,16 @@ class PanelFactory:
     SATELLITE_PANEL = "satellite"
     STATUS_PANEL = "status"
 
+    # Panel class for each type, shared by all factories
+    _PANEL_CLASSES: ClassVar[Dict[str, Type[QWidget]]] = {
+        POSITION_PANEL: PositionPanel,
+        SATELLITE_PANEL: SatellitePanel,
+        STATUS_PANEL: GPSStatusPanel
+    }
+
     def __init__(self):
         """Initialize the panel factory."""
         self._panels: Dict[str, QWidget] = {}
-        self._creation_registry = {
-            self.POSITION_PANEL: self._create_position_panel,
-            self.SATELLITE_PANEL: self._create_satellite_panel,
-            self.STATUS_PANEL: self._create_status_panel
-        }
 
     def create_panel(self, panel_type: str) -> QWidget:
         """
@@ -44,10 +46,11 @@ class PanelFactory:
         Raises:
             ValueError: If panel type is not recognized
         """
-        if panel_type not in self._creation_registry:
+        panel_class = self._PANEL_CLASSES.get(panel_type)
+        if panel_class is None:
             raise ValueError(f"Unknown panel type: {panel_type}")
 
-        panel = self._creation_registry[panel_type]()
+        panel = panel_class()
         self._panels[panel_type] = panel
         return panel
 
@@ -97,16 +100,3 @@ class PanelFactory:
             Dictionary mapping panel types to panel widgets
         """
         return self._panels.copy()
-
-    # Panel creation methods
-    def _create_position_panel(self) -> PositionPanel:
-        """Create position panel."""
-        return PositionPanel()
-
-    def _create_satellite_panel(self) -> SatellitePanel:
-        """Create satellite panel."""
-        return SatellitePanel()
-
-    def _create_status_panel(self) -> GPSStatusPanel:
-        """Create GPS status panel."""
-        return GPSStatusPanel()
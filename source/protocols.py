@@ -3,8 +3,8 @@ Protocol definitions for type-safe interfaces.
 
 Defines contracts for callbacks and interfaces used throughout the application.
 """
-from typing import Protocol, Optional, Dict, Any, Tuple
-from gps_data import GPSData
+from typing import Protocol, Optional, Tuple
+from gps_data import GPSData, PositionInfo, SatelliteInfo
 
 
 class StatusCallbackProtocol(Protocol):
@@ -72,21 +72,21 @@ class GPSDataProviderProtocol(Protocol):
         """
         ...
 
-    def get_satellite_info(self) -> Dict[str, Any]:
+    def get_satellite_info(self) -> SatelliteInfo:
         """
         Get satellite information.
 
         Returns:
-            Dictionary with num_sats and gps_quality
+            SatelliteInfo with num_sats and gps_quality
         """
         ...
 
-    def get_position_info(self) -> Dict[str, Any]:
+    def get_position_info(self) -> PositionInfo:
         """
         Get position information.
 
         Returns:
-            Dictionary with latitude, longitude, height and directions
+            PositionInfo with latitude, longitude, height, their errors and directions
         """
         ...
 
@@ -155,6 +155,18 @@ class CommandFormatterProtocol(Protocol):
         """
         ...
 
+    def format_if_changed(self, gps_data: Optional[GPSData]) -> Optional[str]:
+        """
+        Format GPS data, returning None if the command is unchanged since the last call.
+
+        Args:
+            gps_data: GPS data to format
+
+        Returns:
+            Formatted command string, or None if unchanged
+        """
+        ...
+
 
 class ConnectionManagerProtocol(Protocol):
     """Protocol for connection managers."""
@@ -18,6 +18,11 @@ class ISerialPort(ABC):
         """Read a line from the serial port."""
         pass
 
+    @abstractmethod
+    def read(self, size: int) -> bytes:
+        """Read up to size bytes from the serial port."""
+        pass
+
     @abstractmethod
     def is_open(self) -> bool:
         """Check if the serial port is open."""
@@ -33,6 +38,10 @@ class ISerialPort(ABC):
         """Get the number of bytes waiting to be read."""
         pass
 
+    def cancel_read(self):
+        """Interrupt a blocking read from another thread (no-op for ports that never block)."""
+        pass
+
 
 class SerialPort(ISerialPort):
     """Concrete implementation of serial port using pyserial."""
@@ -51,15 +60,19 @@ class SerialPort(ISerialPort):
         """
         try:
             self._serial = serial.Serial(port, baudrate, timeout=timeout)
-            logger.info(f"Serial port {port} opened successfully at {baudrate} baud")
+            logger.info("Serial port %s opened successfully at %s baud", port, baudrate)
         except serial.SerialException as e:
-            logger.error(f"Error opening serial port {port}: {e}")
+            logger.error("Error opening serial port %s: %s", port, e)
             raise RuntimeError(f"Failed to open serial port {port}: {e}")
 
     def readline(self) -> bytes:
         """Read a line from the serial port."""
         return self._serial.readline()
 
+    def read(self, size: int) -> bytes:
+        """Read up to size bytes from the serial port."""
+        return self._serial.read(size)
+
     def is_open(self) -> bool:
         """Check if the serial port is open."""
         return self._serial.is_open
@@ -73,3 +86,7 @@ class SerialPort(ISerialPort):
     def in_waiting(self) -> int:
         """Get the number of bytes waiting to be read."""
         return self._serial.in_waiting
+
+    def cancel_read(self):
+        """Interrupt a blocking read from another thread."""
+        self._serial.cancel_read()
@@ -1,10 +1,50 @@
-import serial.tools.list_ports
+import sys
+import time
+from typing import List, Optional, Tuple
+
 from PyQt5 import QtCore
+from PyQt5.QtSerialPort import QSerialPortInfo
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
                              QLabel, QComboBox, QPushButton, QSlider)
 
+from throttle import Throttled
+
+# Shortest time between slider label updates while dragging
+SLIDER_LABEL_THROTTLE_MS = 50
+# How long a port scan result is reused before the ports are enumerated again
+PORT_SCAN_CACHE_S = 0.5
+
+# (time.monotonic() of the scan, (device, description) pairs) from the last completed scan
+_last_scan: Optional[Tuple[float, List[Tuple[str, str]]]] = None
+
+
+def _port_device(info: QSerialPortInfo) -> str:
+    """Device name pyserial opens for a port: e.g. "COM3" on Windows, "/dev/ttyUSB0" elsewhere."""
+    return info.portName() if sys.platform == 'win32' else info.systemLocation()
+
+
+class _PortScanner(QtCore.QThread):
+    """Enumerates serial ports off the GUI thread, which can take a while on some platforms."""
+
+    # Emitted with the (device, description) pairs of the ports found
+    ports_found = QtCore.pyqtSignal(list)
+
+    def run(self):
+        global _last_scan
+        ports = [(_port_device(info), info.description()) for info in QSerialPortInfo.availablePorts()]
+        # Replaced in one assignment, so the GUI thread never sees a half-updated cache
+        _last_scan = (time.monotonic(), ports)
+        self.ports_found.emit(ports)
+
 
 class SettingsDialog(QDialog):
+    # Baud rates offered in the combo
+    _BAUD_RATES = ("4800", "9600", "19200", "38400", "57600", "115200")
+    _BAUD_RATE_VALUES = {text: int(text) for text in _BAUD_RATES}
+    # Slider label texts
+    _GPS_UPDATE_FORMAT = "GPS Update: %dms"
+    _RECONNECT_FORMAT = "Reconnect Interval: %dms"
+
     def __init__(self, parent=None, current_port=None, current_baudrate=9600, update_interval=100,
                  reconnect_interval=5000):
         super().__init__(parent)
@@ -16,6 +56,7 @@ class SettingsDialog(QDialog):
         self.current_baudrate = current_baudrate
         self.update_interval = update_interval
         self.reconnect_interval = reconnect_interval
+        self._scanner: Optional[_PortScanner] = None
 
         self.init_ui()
 
@@ -31,15 +72,12 @@ class SettingsDialog(QDialog):
         port_label = QLabel("Port:")
         self.port_combo = QComboBox()
         self.port_combo.setEditable(True)
-        self.scan_ports()
 
-        # Set current port if exists
+        # Show the current port straight away; the scan, started once the dialog is shown,
+        # selects its entry when the list arrives
         if self.current_port:
-            index = self.port_combo.findText(self.current_port)
-            if index >= 0:
-                self.port_combo.setCurrentIndex(index)
-            else:
-                self.port_combo.setEditText(self.current_port)
+            self.port_combo.setEditText(self.current_port)
+        self._scan_on_show = True
 
         scan_button = QPushButton("Scan Ports")
         scan_button.clicked.connect(self.scan_ports)
@@ -52,7 +90,7 @@ class SettingsDialog(QDialog):
         baud_layout = QHBoxLayout()
         baud_label = QLabel("Baud Rate:")
         self.baud_combo = QComboBox()
-        self.baud_combo.addItems(["4800", "9600", "19200", "38400", "57600", "115200"])
+        self.baud_combo.addItems(self._BAUD_RATES)
         self.baud_combo.setCurrentText(str(self.current_baudrate))
 
         baud_layout.addWidget(baud_label)
@@ -69,15 +107,16 @@ class SettingsDialog(QDialog):
 
         # GPS Update interval
         gps_update_layout = QVBoxLayout()
-        self.gps_update_label = QLabel(f"GPS Update: {self.update_interval}ms")
+        self.gps_update_label = QLabel(self._GPS_UPDATE_FORMAT % self.update_interval)
         self.gps_update_slider = QSlider(QtCore.Qt.Horizontal)
         self.gps_update_slider.setMinimum(50)
         self.gps_update_slider.setMaximum(1000)
         self.gps_update_slider.setValue(self.update_interval)
         self.gps_update_slider.setTickPosition(QSlider.TicksBelow)
         self.gps_update_slider.setTickInterval(100)
+        # Dragging emits every intermediate value; the label only needs a few per second
         self.gps_update_slider.valueChanged.connect(
-            lambda v: self.gps_update_label.setText(f"GPS Update: {v}ms")
+            Throttled(self._on_gps_update_changed, SLIDER_LABEL_THROTTLE_MS, self)
         )
 
         gps_update_layout.addWidget(self.gps_update_label)
@@ -85,7 +124,7 @@ class SettingsDialog(QDialog):
 
         # Reconnect interval
         reconnect_layout = QVBoxLayout()
-        self.reconnect_label = QLabel(f"Reconnect Interval: {self.reconnect_interval}ms")
+        self.reconnect_label = QLabel(self._RECONNECT_FORMAT % self.reconnect_interval)
         self.reconnect_slider = QSlider(QtCore.Qt.Horizontal)
         self.reconnect_slider.setMinimum(1000)
         self.reconnect_slider.setMaximum(30000)
@@ -93,7 +132,7 @@ class SettingsDialog(QDialog):
         self.reconnect_slider.setTickPosition(QSlider.TicksBelow)
         self.reconnect_slider.setTickInterval(5000)
         self.reconnect_slider.valueChanged.connect(
-            lambda v: self.reconnect_label.setText(f"Reconnect Interval: {v}ms")
+            Throttled(self._on_reconnect_changed, SLIDER_LABEL_THROTTLE_MS, self)
         )
 
         reconnect_layout.addWidget(self.reconnect_label)
@@ -123,33 +162,77 @@ class SettingsDialog(QDialog):
 
         self.setLayout(main_layout)
 
+    def _on_gps_update_changed(self, value: int):
+        """Show the GPS update slider's value."""
+        self.gps_update_label.setText(self._GPS_UPDATE_FORMAT % value)
+
+    def _on_reconnect_changed(self, value: int):
+        """Show the reconnect slider's value."""
+        self.reconnect_label.setText(self._RECONNECT_FORMAT % value)
+
     def scan_ports(self):
-        """Scan and populate available serial ports."""
-        current_text = self.port_combo.currentText()
+        """Start scanning for serial ports; the port list is repopulated when the scan finishes."""
+        if self._scanner is not None and self._scanner.isRunning():
+            return
+        # Repeated requests in quick succession (reopening the dialog, clicking Scan) reuse the last scan
+        last_scan = _last_scan
+        if last_scan is not None and time.monotonic() - last_scan[0] < PORT_SCAN_CACHE_S:
+            self._populate_ports(last_scan[1])
+            return
+        # Qt's enumeration is quicker than pyserial's and keeps device descriptions intact
+        self._scanner = _PortScanner()
+        self._scanner.ports_found.connect(self._populate_ports)
+        self._scanner.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Scan after the first paint rather than before the dialog appears
+        if self._scan_on_show:
+            self._scan_on_show = False
+            QtCore.QTimer.singleShot(0, self._scan_if_visible)
+
+    def _scan_if_visible(self):
+        """Start the initial port scan, unless the dialog was closed before it got the chance."""
+        if self.isVisible():
+            self.scan_ports()
+
+    def done(self, result):
+        # The scanner thread must not outlive the dialog
+        if self._scanner is not None:
+            self._scanner.wait()
+        super().done(result)
+
+    def _populate_ports(self, ports: List[Tuple[str, str]]):
+        """Fill the port list with scanned (device, description) pairs, keeping the current choice."""
+        current_port = self._selected_port()
         self.port_combo.clear()
 
-        ports = serial.tools.list_ports.comports()
-        for port in ports:
-            self.port_combo.addItem(f"{port.device} - {port.description}", port.device)
+        for device, description in ports:
+            self.port_combo.addItem(f"{device} - {description or 'n/a'}", device)
 
-        # Restore previous selection if still available
-        if current_text:
-            index = self.port_combo.findText(current_text, QtCore.Qt.MatchStartsWith)
+        # Restore previous selection if still available, otherwise keep the typed port.
+        # Matched on the exact device, so /dev/ttyUSB1 does not select /dev/ttyUSB10
+        if current_port:
+            index = self.port_combo.findData(current_port)
             if index >= 0:
                 self.port_combo.setCurrentIndex(index)
+            else:
+                self.port_combo.setEditText(current_port)
+
+    def _selected_port(self) -> str:
+        """Get the device of the selected port entry, or the typed text if none is selected."""
+        # Scanned entries carry their device as item data; typed text is used as it is
+        port: str = self.port_combo.currentText()
+        index = self.port_combo.currentIndex()
+        if index >= 0 and self.port_combo.itemText(index) == port:
+            port = self.port_combo.itemData(index) or port
+        return port
 
     def get_settings(self):
         """Return selected settings as dictionary."""
-        # Extract just the device path if combo format is "device - description"
-        port_text = self.port_combo.currentText()
-        if ' - ' in port_text:
-            port = port_text.split(' - ')[0]
-        else:
-            port = port_text
-
         return {
-            'port': port,
-            'baudrate': int(self.baud_combo.currentText()),
+            'port': self._selected_port(),
+            'baudrate': self._BAUD_RATE_VALUES.get(self.baud_combo.currentText(), self.current_baudrate),
             'update_interval': self.gps_update_slider.value(),
             'reconnect_interval': self.reconnect_slider.value()
         }
@@ -48,20 +48,29 @@ class SettingsMediator:
         """
         Apply new settings to all controllers.
 
+        Only settings that differ from the current ones are applied, so saving
+        unchanged settings does not restart the timers or reconnect a working GPS.
+
         Args:
             settings: Dictionary with new settings
             callback: Optional callback for status updates
         """
+        current = self.get_current_settings()
+
+        def changed(key: str) -> bool:
+            return key in settings and settings[key] != current[key]
+
         # Update timing intervals
-        if 'update_interval' in settings:
+        if changed('update_interval'):
             self.update_controller.set_update_interval(settings['update_interval'])
 
-        if 'reconnect_interval' in settings:
+        if changed('reconnect_interval'):
             self.update_controller.set_reconnect_interval(settings['reconnect_interval'])
 
-        # Update connection parameters (triggers reconnect)
+        # Update connection parameters (triggers reconnect); a disconnected GPS is retried regardless
         connection_changed = False
-        if 'port' in settings or 'baudrate' in settings:
+        if changed('port') or changed('baudrate') or (
+                ('port' in settings or 'baudrate' in settings) and not self.connection_manager.is_connected):
             self.connection_manager.update_connection_params(
                 port=settings.get('port'),
                 baudrate=settings.get('baudrate')
@@ -0,0 +1,45 @@
+"""
+Leading and trailing edge throttling for callbacks driven by bursts of Qt signals.
+"""
+from typing import Callable, Optional
+
+from PyQt5 import QtCore
+
+
+class Throttled:
+    """
+    Wraps a callback so it runs at most once per interval.
+
+    The first call runs straight away; calls during the following interval only
+    record their arguments, and the latest ones are delivered when the interval ends.
+    Must be called from a thread with a Qt event loop.
+    """
+
+    def __init__(self, callback: Callable[..., None], interval_ms: int, parent: Optional[QtCore.QObject] = None):
+        """
+        Initialize the throttle.
+
+        Args:
+            callback: Function to throttle
+            interval_ms: Shortest time between two calls of callback, in milliseconds
+            parent: Owner of the interval timer
+        """
+        self._callback = callback
+        self._pending: Optional[tuple] = None
+        self._timer = QtCore.QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._flush)
+
+    def __call__(self, *args):
+        if self._timer.isActive():
+            self._pending = args
+            return
+        self._callback(*args)
+        self._timer.start()
+
+    def _flush(self):
+        args, self._pending = self._pending, None
+        if args is not None:
+            self._callback(*args)
+            self._timer.start()
@@ -3,6 +3,7 @@ View update coordinator for managing UI updates.
 """
 from typing import Optional, Callable
 
+from gps_data import SatelliteInfo
 from gps_data_controller import GPSDataController
 from Panels.position_panel import PositionPanel
 from Panels.satellite_panel import SatellitePanel
@@ -45,6 +46,9 @@ class ViewUpdateCoordinator:
         self.command_formatter = command_formatter
         self.command_field_updater = command_field_updater
         self.status_callback = status_callback
+        # Satellite info last pushed to the panel; the controller returns the same object while it is unchanged
+        self._shown_sat_info: Optional[SatelliteInfo] = None
+        self._sat_message: Optional[str] = None
 
     def update_all(self) -> None:
         """
@@ -57,15 +61,16 @@ class ViewUpdateCoordinator:
             self._handle_disconnected_state()
             return
 
+        sat_info = self.data_controller.get_satellite_info()
+
         # Update all panels
         self.update_position_panel()
-        self.update_status_panels()
+        self.update_status_panels(sat_info)
         self.update_command_field()
 
-        # Update status bar
-        sat_info = self.data_controller.get_satellite_info()
-        if self.status_callback and sat_info['num_sats'] is not None:
-            self.status_callback(f"Number of Satellites: {sat_info['num_sats']}")
+        # Update status bar (re-sent each time so it comes back after temporary messages)
+        if self.status_callback and self._sat_message is not None:
+            self.status_callback(self._sat_message)
 
     def update_position_panel(self) -> None:
         """Update position panel with current GPS position data."""
@@ -79,12 +84,22 @@ class ViewUpdateCoordinator:
             if self.status_callback:
                 self.status_callback(f"GPS Error: {e}")
 
-    def update_status_panels(self) -> None:
-        """Update satellite and GPS status panels."""
+    def update_status_panels(self, sat_info: Optional[SatelliteInfo] = None) -> None:
+        """
+        Update satellite and GPS status panels.
+
+        Args:
+            sat_info: Satellite info already fetched this update, to avoid fetching it again
+        """
         if self.data_controller.is_connected:
-            sat_info = self.data_controller.get_satellite_info()
-            self.satellite_panel.set_num_sats(sat_info['num_sats'])
-            self.satellite_panel.set_fix_quality(sat_info['gps_quality'])
+            if sat_info is None:
+                sat_info = self.data_controller.get_satellite_info()
+            if sat_info is not self._shown_sat_info:
+                self._shown_sat_info = sat_info
+                self.satellite_panel.set_num_sats(sat_info.num_sats)
+                self.satellite_panel.set_fix_quality(sat_info.gps_quality)
+                self._sat_message = (f"Number of Satellites: {sat_info.num_sats}"
+                                     if sat_info.num_sats is not None else None)
             self.status_panel.set_connection_status(True)
             self.status_panel.update_timestamp()
         else:
@@ -94,8 +109,10 @@ class ViewUpdateCoordinator:
         """Update Meshtastic command field with current GPS data."""
         if self.command_field_updater:
             gps_data = self.data_controller.get_current_data()
-            command = self.command_formatter.format(gps_data)
-            self.command_field_updater(command)
+            # Skip setText (which also resets the field's selection) when the command is unchanged
+            command = self.command_formatter.format_if_changed(gps_data)
+            if command is not None:
+                self.command_field_updater(command)
 
     def _handle_disconnected_state(self) -> None:
         """Handle UI updates when GPS is disconnected."""
@@ -1,10 +1,17 @@
 """
 Pytest fixtures for GPS Module tests.
 """
+import os
 import sys
+from collections import deque
 from pathlib import Path
+from typing import Union
 
 import pytest
+from PyQt5.QtWidgets import QApplication
+
+# Panel tests build real widgets; render them offscreen unless a platform is chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 # Add source directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "source"))
@@ -13,31 +20,52 @@ from gps_data import GPSData
 from serial_port import ISerialPort
 
 
+def _to_bytes(response: Union[str, bytes]) -> bytes:
+    """Encode a text response; byte responses are queued as they are."""
+    return response.encode('utf-8') if isinstance(response, str) else bytes(response)
+
+
 class MockSerialPort(ISerialPort):
     """Mock serial port for testing without hardware."""
 
-    def __init__(self, responses: list[bytes] = None):
+    def __init__(self, responses: list[Union[str, bytes]] = None):
         """
         Initialize mock serial port.
 
         Args:
-            responses: List of byte responses to return from readline()
+            responses: List of responses to return from readline(); text is encoded as UTF-8
         """
-        self._responses = responses or []
-        self._index = 0
+        # Stored as bytes, consumed from the left; _offset counts bytes already read from the first
+        self._responses = deque(map(_to_bytes, responses or ()))
+        self._offset = 0
         self._is_open = True
 
-    def add_response(self, response: str) -> None:
-        """Add a response to the queue."""
-        self._responses.append(response.encode('utf-8'))
+    def add_response(self, response: Union[str, bytes]) -> None:
+        """Add a response to the queue; text is encoded as UTF-8."""
+        self._responses.append(_to_bytes(response))
 
     def readline(self) -> bytes:
-        """Return next response from queue."""
-        if self._index < len(self._responses):
-            response = self._responses[self._index]
-            self._index += 1
-            return response
-        return b''
+        """Return the rest of the next response from the queue."""
+        if not self._responses:
+            return b''
+        response = self._responses.popleft()[self._offset:]
+        self._offset = 0
+        return response
+
+    def read(self, size: int) -> bytes:
+        """Return up to size bytes from the queued responses, as a byte stream."""
+        responses = self._responses
+        chunks = []
+        while size > 0 and responses:
+            head = responses[0]
+            chunk = head[self._offset:self._offset + size]
+            chunks.append(chunk)
+            size -= len(chunk)
+            self._offset += len(chunk)
+            if self._offset >= len(head):
+                responses.popleft()
+                self._offset = 0
+        return b''.join(chunks)
 
     def is_open(self) -> bool:
         return self._is_open
@@ -46,8 +74,8 @@ class MockSerialPort(ISerialPort):
         self._is_open = False
 
     def in_waiting(self) -> int:
-        """Return number of responses remaining."""
-        return len(self._responses) - self._index
+        """Return number of bytes remaining."""
+        return sum(map(len, self._responses)) - self._offset
 
 
 @pytest.fixture
@@ -86,3 +114,9 @@ def sample_nmea_gga():
 def sample_nmea_rmc():
     """Sample NMEA RMC sentence."""
     return "$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A"
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Application for widgets, and the event loop for delivering queued signals and timers to the test thread."""
+    return QApplication.instance() or QApplication([])
@@ -53,6 +53,29 @@ class TestMeshtasticCommandFormatter:
         assert "--setlon 151.2093" in result
 
 
+    def test_format_reuses_result_for_unchanged_data(self, formatter, sample_gps_data):
+        """Test unchanged data returns the cached string and changed data re-formats."""
+        first = formatter.format(sample_gps_data)
+
+        assert formatter.format(sample_gps_data) is first
+
+        sample_gps_data.height = 71.0
+        result = formatter.format(sample_gps_data)
+
+        assert "--setalt 71.0" in result
+
+    def test_format_if_changed(self, formatter, sample_gps_data):
+        """Test format_if_changed returns None until the command changes."""
+        assert formatter.format_if_changed(None) == formatter.get_placeholder()
+        assert formatter.format_if_changed(None) is None
+
+        assert "--setlat 49.2827" in formatter.format_if_changed(sample_gps_data)
+        assert formatter.format_if_changed(sample_gps_data) is None
+
+        sample_gps_data.latitude = 50.0
+        assert "--setlat 50.0" in formatter.format_if_changed(sample_gps_data)
+
+
 class TestNMEACommandFormatter:
     """Tests for NMEACommandFormatter."""
 
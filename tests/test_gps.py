@@ -89,6 +89,15 @@ class TestGT_U7GPSClose:
         # Should not raise
         gps.close()
 
+    def test_close_twice(self, mock_serial):
+        """Test a second close() is a no-op after the port is released."""
+        gps = GT_U7GPS(serial_port=mock_serial)
+
+        gps.close()
+        gps.close()
+
+        assert gps.ser is None
+
 
 class TestGT_U7GPSReadData:
     """Tests for GT_U7GPS read_gps_data method."""
@@ -137,13 +146,72 @@ class TestGT_U7GPSReadData:
     def test_read_gps_data_handles_decode_error(self, mock_serial):
         """Test read_gps_data handles decode errors gracefully."""
         # Add invalid UTF-8 bytes
-        mock_serial._responses.append(b'\xff\xfe invalid utf8')
+        mock_serial.add_response(b'\xff\xfe invalid utf8')
 
         gps = GT_U7GPS(serial_port=mock_serial)
 
         # Should not raise, just log error
         gps.read_gps_data()
 
+    def test_read_gps_data_skips_non_ascii_noise(self, mock_serial):
+        """Test stray non-ASCII bytes do not cost the sentences around them."""
+        mock_serial.add_response(
+            b'\xff\xfe noise\r\n$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n')
+
+        gps = GT_U7GPS(serial_port=mock_serial)
+        gps.read_gps_data()
+
+        assert gps.latitude == pytest.approx(48.1173, rel=0.001)
+
+    def test_read_gps_data_keeps_partial_sentence(self, mock_serial):
+        """Test a sentence split across two reads is parsed once complete."""
+        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n"
+        mock_serial.add_response(sentence[:30])
+
+        gps = GT_U7GPS(serial_port=mock_serial)
+        gps.read_gps_data()
+
+        assert gps.latitude == 0.0
+
+        mock_serial.add_response(sentence[30:])
+        gps.read_gps_data()
+
+        assert gps.latitude == pytest.approx(48.1173, rel=0.001)
+
+    def test_read_gps_data_reports_received(self, mock_serial):
+        """Test read_gps_data returns whether any bytes arrived, with or without waiting."""
+        gps = GT_U7GPS(serial_port=mock_serial)
+
+        assert gps.read_gps_data() is False
+        assert gps.read_gps_data(wait=True) is False
+
+        mock_serial.add_response("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n")
+
+        assert gps.read_gps_data(wait=True) is True
+        assert gps.num_sats == 8
+
+    def test_read_gps_data_drains_in_one_read(self, mock_serial):
+        """Test all waiting bytes are fetched with a single read call."""
+        mock_serial.add_response("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n")
+        mock_serial.add_response("$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A\r\n")
+        reads = []
+        original_read = mock_serial.read
+        mock_serial.read = lambda size: reads.append(size) or original_read(size)
+
+        gps = GT_U7GPS(serial_port=mock_serial)
+        gps.read_gps_data()
+
+        assert len(reads) == 1
+        assert mock_serial.in_waiting() == 0
+
+    def test_read_gps_data_after_close_raises(self, mock_serial):
+        """Test reading a closed GPS reports the closed port."""
+        gps = GT_U7GPS(serial_port=mock_serial)
+        gps.close()
+
+        with pytest.raises(RuntimeError, match="port is closed"):
+            gps.read_gps_data()
+
 
 class TestGT_U7GPSDataProperty:
     """Tests for GT_U7GPS data property."""
@@ -0,0 +1,88 @@
+"""
+Tests for GPSConnectionManager.
+"""
+import time
+
+from gps_connection_manager import GPSConnectionManager
+
+MISSING_PORT = "/dev/gps-module-test-missing"
+
+
+def process_events_until(qapp, condition, attempts=500):
+    """Process queued events until condition() holds or the attempts run out."""
+    for _ in range(attempts):
+        if condition():
+            return True
+        qapp.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+class TestReconnectAsync:
+    """Tests for reconnecting without blocking the calling thread."""
+
+    def test_failed_reconnect_is_reported(self, qapp):
+        """Test a port that cannot be opened ends the reconnection and reports the failure."""
+        messages = []
+        manager = GPSConnectionManager(MISSING_PORT, 9600, status_callback=messages.append)
+
+        manager.reconnect_async()
+
+        assert manager.is_reconnecting
+        assert process_events_until(qapp, lambda: not manager.is_reconnecting)
+        assert not manager.is_connected
+        assert messages[0] == "Attempting to reconnect to GPS..."
+        assert len(messages) == 2 and messages[1].startswith("GPS reconnection failed: ")
+        assert MISSING_PORT in messages[1]
+
+    def test_second_request_while_opening_is_ignored(self, qapp):
+        """Test only one reconnection runs at a time."""
+        messages = []
+        manager = GPSConnectionManager(MISSING_PORT, 9600, status_callback=messages.append)
+
+        manager.reconnect_async()
+        manager.reconnect_async()
+        process_events_until(qapp, lambda: not manager.is_reconnecting)
+
+        assert messages.count("Attempting to reconnect to GPS...") == 1
+
+    def test_disconnect_abandons_pending_reconnect(self, qapp):
+        """Test disconnecting while the port is being opened cancels the reconnection."""
+        messages = []
+        manager = GPSConnectionManager(MISSING_PORT, 9600, status_callback=messages.append)
+
+        manager.reconnect_async()
+        manager.disconnect()
+        process_events_until(qapp, lambda: False, attempts=20)
+
+        assert not manager.is_reconnecting
+        assert not manager.is_connected
+        assert not any(message.startswith("GPS reconnection failed") for message in messages)
+
+    def test_update_connection_params_replaces_pending_reconnect(self, qapp):
+        """Test new connection parameters are applied even while a reconnect_async is opening the port."""
+        messages = []
+        manager = GPSConnectionManager(MISSING_PORT, 9600, status_callback=messages.append)
+        new_port = MISSING_PORT + "-new"
+
+        manager.reconnect_async()
+        manager.update_connection_params(port=new_port, baudrate=4800)
+        process_events_until(qapp, lambda: False, attempts=20)
+
+        assert not manager.is_reconnecting
+        assert messages.count("Attempting to reconnect to GPS...") == 2
+        failures = [message for message in messages if message.startswith("GPS reconnection failed")]
+        assert len(failures) == 1 and new_port in failures[0]
+
+
+class TestReconnect:
+    """Tests for reconnecting on the calling thread."""
+
+    def test_failed_reconnect_reports_reason(self):
+        """Test the reconnection outcome carries the error that stopped the port opening."""
+        messages = []
+        manager = GPSConnectionManager(MISSING_PORT, 9600, status_callback=messages.append)
+
+        assert manager.reconnect() is False
+        assert messages[-1].startswith("GPS reconnection failed: ")
+        assert MISSING_PORT in messages[-1]
@@ -1,6 +1,9 @@
 """
 Tests for GPSData dataclass.
 """
+import sys
+from copy import deepcopy
+
 import pytest
 from gps_data import GPSData
 
@@ -37,6 +40,25 @@ class TestGPSData:
         assert data.num_sats == 8
         assert data.gps_quality == 1
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_rejects_unknown_attributes(self, gps_data):
+        """Test slotted GPSData has no per-instance __dict__."""
+        with pytest.raises(AttributeError):
+            gps_data.speed = 1.0
+
+    def test_deepcopy_preserves_values(self, sample_gps_data):
+        """Test GPSData copies cleanly, as used by GPSStatistics."""
+        copied = deepcopy(sample_gps_data)
+
+        assert copied == sample_gps_data
+        assert copied is not sample_gps_data
+
+    def test_reset_restores_defaults(self, sample_gps_data):
+        """Test reset returns every field to its default in place."""
+        sample_gps_data.reset()
+
+        assert sample_gps_data == GPSData()
+
 
 class TestGPSDataIsValid:
     """Tests for GPSData.is_valid() method."""
@@ -110,6 +132,11 @@ class TestGPSDataToDict:
         assert result['num_sats'] == sample_gps_data.num_sats
         assert result['gps_quality'] == sample_gps_data.gps_quality
 
+    def test_items_match_to_dict(self, sample_gps_data):
+        """Test items() yields the same pairs as to_dict(), in field order."""
+        assert dict(sample_gps_data.items()) == sample_gps_data.to_dict()
+        assert [name for name, _ in sample_gps_data.items()] == list(sample_gps_data.to_dict())
+
     def test_to_dict_default_values(self, gps_data):
         """Test to_dict with default values."""
         result = gps_data.to_dict()
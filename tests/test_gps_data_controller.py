@@ -0,0 +1,122 @@
+"""
+Tests for GPSDataController.
+"""
+import pytest
+import gps_data_controller
+from gps import GT_U7GPS
+from gps_connection_manager import GPSConnectionManager
+from gps_data import GPSData
+from gps_data_controller import GPSDataController
+from gps_statistics import GPSStatistics
+
+
+class FakeReader:
+    """Reader stand-in exposing a fixed latest snapshot."""
+
+    def __init__(self, latest: GPSData):
+        self.latest = latest
+        self.published = 1
+
+    def publish(self, latest: GPSData):
+        """Publish a new snapshot, as the reader thread does."""
+        self.latest = latest
+        self.published += 1
+
+
+class FakeConnectionManager:
+    """Connected manager stand-in around a FakeReader."""
+
+    def __init__(self, latest: GPSData):
+        self.reader = FakeReader(latest)
+        self.is_connected = True
+
+
+def fix(latitude=48.0, longitude=11.0, height=500.0, gps_quality=1, num_sats=8):
+    """Build a GPSData snapshot, a valid fix by default."""
+    return GPSData(latitude=latitude, longitude=longitude, height=height,
+                   gps_quality=gps_quality, num_sats=num_sats)
+
+
+class TestGPSDataController:
+    """Tests for the GPS data controller."""
+
+    def test_has_new_data_follows_reader_snapshots(self, mock_serial):
+        """Test new data is reported once per published snapshot and per new reader."""
+        manager = GPSConnectionManager(port="/dev/null", baudrate=9600)
+        controller = GPSDataController(manager)
+        assert not controller.has_new_data()
+
+        manager.inject_gps_instance(GT_U7GPS(serial_port=mock_serial))
+        try:
+            # Nothing published yet: the reader only holds the data it started with
+            assert not controller.has_new_data()
+
+            mock_serial.add_response("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n")
+            for _ in range(500):
+                if manager.reader.published:
+                    break
+                manager.reader.wait(10)
+
+            assert controller.has_new_data()
+            assert not controller.has_new_data()
+        finally:
+            manager.disconnect()
+
+        assert controller.has_new_data()
+
+    def test_position_info_skips_fix_without_altitude(self, monkeypatch):
+        """Test a fix with an empty altitude leaves the statistics window as it was."""
+        monkeypatch.setattr(gps_data_controller, 'gps_stats', GPSStatistics(10))
+        manager = FakeConnectionManager(fix())
+        controller = GPSDataController(manager)
+        controller.get_position_info()
+
+        manager.reader.publish(fix(latitude=49.0, longitude=12.0, height=None))
+        info = controller.get_position_info()
+
+        assert info.latitude == pytest.approx(48.0)
+        assert info.height == pytest.approx(500.0)
+
+    def test_position_info_skips_invalid_fix(self, monkeypatch):
+        """Test snapshots without a fix or a position are not sampled."""
+        monkeypatch.setattr(gps_data_controller, 'gps_stats', GPSStatistics(10))
+        manager = FakeConnectionManager(fix())
+        controller = GPSDataController(manager)
+        controller.get_position_info()
+
+        manager.reader.publish(fix(latitude=10.0, gps_quality=0))
+        controller.get_position_info()
+        manager.reader.publish(fix(latitude=0.0, longitude=0.0))
+        info = controller.get_position_info()
+
+        assert info.latitude == pytest.approx(48.0)
+        assert info.longitude == pytest.approx(11.0)
+
+    def test_position_info_samples_each_snapshot_once(self, monkeypatch):
+        """Test polling the same published snapshot repeatedly adds it to the window once."""
+        monkeypatch.setattr(gps_data_controller, 'gps_stats', GPSStatistics(10))
+        manager = FakeConnectionManager(fix())
+        controller = GPSDataController(manager)
+
+        for _ in range(3):
+            controller.get_position_info()
+        manager.reader.publish(fix(latitude=50.0))
+        controller.get_position_info()
+        info = controller.get_position_info()
+
+        # Two samples, 48 and 50; re-adding the first snapshot would pull the mean toward 48
+        assert info.latitude == pytest.approx(49.0)
+
+    def test_unpublished_reader_is_not_new_data(self, monkeypatch):
+        """Test a reader that has not published is neither new data nor sampled."""
+        monkeypatch.setattr(gps_data_controller, 'gps_stats', GPSStatistics(10))
+        manager = FakeConnectionManager(fix())
+        manager.reader.published = 0
+        controller = GPSDataController(manager)
+
+        assert not controller.has_new_data()
+        assert controller.get_position_info().latitude is None
+
+        manager.reader.publish(fix(latitude=50.0))
+        assert controller.has_new_data()
+        assert controller.get_position_info().latitude == pytest.approx(50.0)
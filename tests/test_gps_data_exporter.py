@@ -0,0 +1,103 @@
+"""
+Tests for the GPS data exporters.
+"""
+import re
+
+import pytest
+from gps_data import GPSData
+from gps_data_exporter import CSVExporter, CSV_HEADER, GPSDataExporter
+
+
+class TestCSVExporter:
+    """Tests for CSV export."""
+
+    def test_export_writes_header_and_row(self, tmp_path):
+        """Test a fix is written as a header line and one data row."""
+        filename = tmp_path / "fix.csv"
+        data = GPSData(latitude=48.1173, longitude=11.5167, height=545.4, num_sats=8, gps_quality=1)
+
+        CSVExporter().export(data, str(filename))
+
+        header, row = filename.read_text().splitlines()
+        assert header + "\n" == CSV_HEADER
+        assert row.split(",")[1:] == ["48.1173", "11.5167", "545.4", "8", "GPS"]
+
+    def test_export_unknown_quality(self, tmp_path):
+        """Test an unrecognized fix quality is exported as Unknown."""
+        filename = tmp_path / "fix.csv"
+
+        CSVExporter().export(GPSData(gps_quality=7), str(filename))
+
+        assert filename.read_text().splitlines()[1].endswith(",Unknown")
+
+    def test_export_many_writes_one_row_per_sample(self, tmp_path):
+        """Test a series of samples is written below a single header."""
+        filename = tmp_path / "track.csv"
+        samples = [GPSData(latitude=48.0 + i, longitude=11.5, height=500.0, num_sats=i, gps_quality=i % 3)
+                   for i in range(4)]
+
+        CSVExporter().export_many(samples, str(filename))
+
+        lines = filename.read_text().splitlines()
+        assert lines[0] + "\n" == CSV_HEADER
+        assert [line.split(",")[1:] for line in lines[1:]] == [
+            ["48.0", "11.5", "500.0", "0", "Invalid"],
+            ["49.0", "11.5", "500.0", "1", "GPS"],
+            ["50.0", "11.5", "500.0", "2", "DGPS"],
+            ["51.0", "11.5", "500.0", "3", "Invalid"],
+        ]
+
+    def test_export_many_writes_lf_only_bytes(self, tmp_path, monkeypatch):
+        """Test the header and every row end in a bare LF, matching the pre-encoded header."""
+        monkeypatch.setattr("gps_data_exporter.time.strftime", lambda fmt: "2024-01-02 03:04:05")
+        filename = tmp_path / "track.csv"
+        samples = [GPSData(latitude=48.1173, longitude=11.5167, height=545.4, num_sats=8, gps_quality=1),
+                   GPSData(latitude=-43.5, longitude=172.5, height=25.0, num_sats=13, gps_quality=2)]
+
+        CSVExporter().export_many(samples, str(filename))
+
+        assert filename.read_bytes() == (b"Timestamp,Latitude,Longitude,Height (m),Satellites,GPS Quality\n"
+                                         b"2024-01-02 03:04:05,48.1173,11.5167,545.4,8,GPS\n"
+                                         b"2024-01-02 03:04:05,-43.5,172.5,25.0,13,DGPS\n")
+
+    def test_export_failure_raises(self, tmp_path):
+        """Test an unwritable path raises OSError."""
+        with pytest.raises(OSError):
+            CSVExporter().export(GPSData(), str(tmp_path / "missing" / "fix.csv"))
+
+
+class TestGPSDataExporter:
+    """Tests for the high-level exporter."""
+
+    def test_export_to_file_success(self, tmp_path):
+        """Test a fix with a position exports without an error message."""
+        filename = tmp_path / "fix.csv"
+
+        result = GPSDataExporter().export_to_file(GPSData(latitude=48.1, longitude=11.5), str(filename))
+
+        assert result == (True, None)
+        assert filename.exists()
+
+    def test_export_to_file_without_position(self, tmp_path):
+        """Test data without a position is rejected before writing."""
+        filename = tmp_path / "fix.csv"
+
+        success, error = GPSDataExporter().export_to_file(GPSData(), str(filename))
+
+        assert not success
+        assert "No GPS position" in error
+        assert not filename.exists()
+
+    def test_export_to_file_reports_write_failure(self, tmp_path):
+        """Test a write failure is returned as an error message."""
+        success, error = GPSDataExporter().export_to_file(GPSData(latitude=48.1, longitude=11.5),
+                                                          str(tmp_path / "missing" / "fix.csv"))
+
+        assert not success
+        assert error.startswith("Failed to export data:")
+
+    def test_generate_default_filename(self):
+        """Test the default filename carries a timestamp and the exporter's extension."""
+        filename = GPSDataExporter().generate_default_filename()
+
+        assert re.fullmatch(r"gps_data_\d{8}_\d{6}\.csv", filename)
@@ -0,0 +1,158 @@
+"""
+Tests for GPSReaderThread.
+"""
+import threading
+import time
+
+import pytest
+from PyQt5.QtCore import Qt
+from tests.conftest import MockSerialPort
+from gps import GT_U7GPS
+from gps_reader_thread import GPSReaderThread
+
+
+class FailingGPS(GT_U7GPS):
+    """GPS whose reads always fail, as when the device is unplugged."""
+
+    def read_gps_data(self, wait=False):
+        raise RuntimeError("device gone")
+
+
+class BlockingSerialPort(MockSerialPort):
+    """Port with no data whose reads block, like a real port, until cancelled."""
+
+    def __init__(self):
+        super().__init__()
+        self.read_started = threading.Event()
+        self._cancelled = threading.Event()
+
+    def read(self, size: int) -> bytes:
+        self.read_started.set()
+        self._cancelled.wait(5)
+        return b''
+
+    def cancel_read(self):
+        self._cancelled.set()
+
+
+class TrickleSerialPort(MockSerialPort):
+    """Port that reports one queued response at a time as waiting, like a burst still arriving."""
+
+    def in_waiting(self) -> int:
+        return len(self._responses[0]) - self._offset if self._responses else 0
+
+
+class TestGPSReaderThread:
+    """Tests for the background GPS reader."""
+
+    def test_initial_snapshot_is_a_copy(self, mock_serial):
+        """Test the reader starts with a snapshot, not the live data object."""
+        gps = GT_U7GPS(serial_port=mock_serial)
+        reader = GPSReaderThread(gps)
+
+        assert reader.latest == gps.data
+        assert reader.latest is not gps.data
+        assert reader.published == 0
+
+    def test_publishes_parsed_data(self, mock_serial):
+        """Test a running reader publishes parsed sentences."""
+        mock_serial.add_response("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n")
+        gps = GT_U7GPS(serial_port=mock_serial)
+        reader = GPSReaderThread(gps, read_interval_ms=1)
+
+        reader.start()
+        for _ in range(500):
+            if reader.latest.num_sats:
+                break
+            reader.wait(10)
+        reader.stop()
+
+        assert reader.latest.latitude == pytest.approx(48.1173, rel=0.001)
+        assert reader.latest.num_sats == 8
+        assert reader.published >= 1
+        assert reader.error is None
+
+    def test_read_error_stops_thread(self, mock_serial):
+        """Test a failed read is recorded, signalled and ends the thread."""
+        reader = GPSReaderThread(FailingGPS(serial_port=mock_serial))
+        failures = []
+        reader.read_failed.connect(failures.append, Qt.DirectConnection)
+
+        reader.start()
+        assert reader.wait(5000)
+
+        assert reader.error == "device gone"
+        assert failures == ["device gone"]
+
+    def test_publish_emits_snapshot(self, mock_serial):
+        """Test every published snapshot is signalled."""
+        mock_serial.add_response("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n")
+        reader = GPSReaderThread(GT_U7GPS(serial_port=mock_serial), read_interval_ms=1)
+        snapshots = []
+        reader.snapshot_ready.connect(snapshots.append, Qt.DirectConnection)
+
+        reader.start()
+        for _ in range(500):
+            if reader.published:
+                break
+            reader.wait(10)
+        reader.stop()
+
+        assert len(snapshots) == reader.published
+        assert snapshots[-1] is reader.latest
+
+    def test_published_snapshots_are_never_rewritten(self):
+        """Test later publishes leave earlier snapshots as they were."""
+        port = MockSerialPort()
+        reader = GPSReaderThread(GT_U7GPS(serial_port=port), read_interval_ms=1)
+        snapshots = []
+        reader.snapshot_ready.connect(snapshots.append, Qt.DirectConnection)
+
+        reader.start()
+        for sentence in ("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F",
+                         "$GPGGA,123520,4907.038,N,01231.000,E,1,10,0.8,600.0,M,47.0,M,,*49",
+                         "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F"):
+            published = reader.published
+            port.add_response(sentence + "\r\n")
+            for _ in range(500):
+                if reader.published > published:
+                    break
+                reader.wait(10)
+        reader.stop()
+
+        assert [s.num_sats for s in snapshots] == [8, 10, 8]
+        assert len({id(s) for s in snapshots}) == 3
+
+    def test_stop_interrupts_blocked_read(self):
+        """Test stop() wakes a reader blocked on the serial port instead of waiting out the timeout."""
+        port = BlockingSerialPort()
+        reader = GPSReaderThread(GT_U7GPS(serial_port=port))
+
+        reader.start()
+        assert port.read_started.wait(5)
+        started = time.monotonic()
+        reader.stop()
+
+        assert reader.isFinished()
+        assert time.monotonic() - started < 1
+
+    def test_burst_is_published_once(self, sample_nmea_rmc):
+        """Test sentences arriving over several drains are published as one snapshot."""
+        port = TrickleSerialPort()
+        for sentence in (sample_nmea_rmc, "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F",
+                         sample_nmea_rmc):
+            port.add_response(sentence + "\r\n")
+        reader = GPSReaderThread(GT_U7GPS(serial_port=port), read_interval_ms=1)
+        snapshots = []
+        reader.snapshot_ready.connect(snapshots.append, Qt.DirectConnection)
+
+        reader.start()
+        for _ in range(500):
+            if reader.published:
+                break
+            reader.wait(10)
+        reader.wait(50)
+        reader.stop()
+
+        assert len(snapshots) == 1
+        assert reader.latest.num_sats == 8
@@ -0,0 +1,129 @@
+"""
+Tests for GPSStatistics.
+"""
+import statistics
+
+import pytest
+from gps_data import GPSData
+from gps_statistics import GPSStatistics
+
+
+def make_data(latitude, longitude, height):
+    """Build a GPSData with only the fields GPSStatistics reads."""
+    return GPSData(latitude=latitude, longitude=longitude, height=height)
+
+
+class TestGPSStatistics:
+    """Tests for the rolling-window statistics."""
+
+    def test_empty_window_returns_none(self):
+        """Test every statistic is None before any data is added."""
+        stats = GPSStatistics(5)
+        empty = {'latitude': None, 'longitude': None, 'height': None}
+
+        assert stats.get_mean() == empty
+        assert stats.get_median() == empty
+        assert stats.get_mode() == empty
+        assert stats.get_stdev() == empty
+
+    def test_mean_median_and_stdev(self):
+        """Test statistics over a partly filled window."""
+        stats = GPSStatistics(5)
+        for lat, lon, h in [(1.0, 10.0, 100.0), (2.0, 20.0, 200.0), (6.0, 30.0, 600.0)]:
+            stats.add_data(make_data(lat, lon, h))
+
+        assert stats.get_mean() == pytest.approx({'latitude': 3.0, 'longitude': 20.0, 'height': 300.0})
+        assert stats.get_median() == {'latitude': 2.0, 'longitude': 20.0, 'height': 200.0}
+        assert stats.get_stdev() == pytest.approx({'latitude': 2.6457513, 'longitude': 10.0, 'height': 264.57513})
+
+    def test_stdev_needs_two_samples(self):
+        """Test stdev is None with a single sample."""
+        stats = GPSStatistics(5)
+        stats.add_data(make_data(1.0, 2.0, 3.0))
+
+        assert stats.get_stdev() == {'latitude': None, 'longitude': None, 'height': None}
+
+    def test_stdev_of_constant_window_is_exactly_zero(self):
+        """Test a stationary fix has zero spread, though its running-sum mean is inexact."""
+        stats = GPSStatistics(100)
+        for _ in range(30):
+            stats.add_data(make_data(48.1173, 11.5167, 545.4))
+
+        assert stats.get_stdev() == {'latitude': 0.0, 'longitude': 0.0, 'height': 0.0}
+
+    def test_mode(self):
+        """Test the most common value is reported per field."""
+        stats = GPSStatistics(5)
+        for lat in (1.0, 2.0, 2.0):
+            stats.add_data(make_data(lat, 5.0, 7.0))
+
+        assert stats.get_mode() == {'latitude': 2.0, 'longitude': 5.0, 'height': 7.0}
+
+    def test_mode_without_unique_value_is_none(self):
+        """Test a tie for the most common value yields None."""
+        stats = GPSStatistics(5)
+        for lat, lon in [(1.0, 4.0), (2.0, 4.0), (1.0, 5.0), (2.0, 6.0)]:
+            stats.add_data(make_data(lat, lon, 3.0))
+
+        assert stats.get_mode() == {'latitude': None, 'longitude': 4.0, 'height': 3.0}
+
+    def test_window_drops_oldest(self):
+        """Test only the last N samples are kept."""
+        stats = GPSStatistics(2)
+        for lat in (100.0, 1.0, 3.0):
+            stats.add_data(make_data(lat, lat, lat))
+
+        assert stats.get_mean() == pytest.approx({'latitude': 2.0, 'longitude': 2.0, 'height': 2.0})
+
+    def test_later_changes_to_source_do_not_leak(self):
+        """Test the window keeps the values at the time they were added."""
+        stats = GPSStatistics(5)
+        data = make_data(1.0, 2.0, 3.0)
+        stats.add_data(data)
+        data.latitude = 50.0
+
+        assert stats.get_mean()['latitude'] == 1.0
+
+    def test_running_mean_tracks_window_over_many_samples(self):
+        """Test the incrementally maintained mean matches the window after many evictions."""
+        stats = GPSStatistics(7)
+        samples = [(48.0 + i * 1.0e-7, -123.0 - i * 3.0e-7, 500.0 + (i % 13) * 0.1) for i in range(1000)]
+        for lat, lon, h in samples:
+            stats.add_data(make_data(lat, lon, h))
+
+        window = samples[-7:]
+        expected = {
+            'latitude': sum(s[0] for s in window) / 7,
+            'longitude': sum(s[1] for s in window) / 7,
+            'height': sum(s[2] for s in window) / 7,
+        }
+        assert stats.get_mean() == pytest.approx(expected, rel=1e-12)
+
+    def test_median_tracks_window_over_evictions(self):
+        """Test the median follows the window as old samples are evicted."""
+        stats = GPSStatistics(4)
+        values = [5.0, 1.0, 9.0, 1.0, 7.0, 3.0, 3.0, 8.0, 2.0]
+        for i, v in enumerate(values):
+            stats.add_data(make_data(v, -v, v * 10))
+            window = sorted(values[max(0, i - 3):i + 1])
+            n = len(window)
+            expected = window[n // 2] if n % 2 else (window[n // 2 - 1] + window[n // 2]) / 2
+
+            assert stats.get_median()['latitude'] == expected
+            assert stats.get_median()['longitude'] == -expected
+
+    def test_stdev_matches_statistics_module_on_long_window(self):
+        """Test the float standard deviation agrees with statistics.stdev for GPS-scale jitter."""
+        stats = GPSStatistics(600)
+        samples = [(48.1173 + ((i * 7919) % 101) * 1.0e-6, 11.5167 - ((i * 104729) % 97) * 1.0e-6,
+                    545.4 + ((i * 31) % 17) * 0.05) for i in range(1000)]
+        for lat, lon, h in samples:
+            stats.add_data(make_data(lat, lon, h))
+
+        window = samples[-600:]
+        expected = {
+            'latitude': statistics.stdev(s[0] for s in window),
+            'longitude': statistics.stdev(s[1] for s in window),
+            'height': statistics.stdev(s[2] for s in window),
+        }
+        assert stats.get_stdev() == pytest.approx(expected, rel=1e-9)
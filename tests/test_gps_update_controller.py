@@ -0,0 +1,31 @@
+"""
+Tests for GPSUpdateController.
+"""
+from gps_update_controller import GPSUpdateController
+
+
+def make_controller(update_interval_ms=100):
+    """Build a controller with no-op callbacks."""
+    return GPSUpdateController(update_interval_ms, 5000, lambda: None, lambda: None)
+
+
+class TestGPSUpdateController:
+    """Tests for the update timer controller."""
+
+    def test_timer_runs_at_update_interval(self):
+        """Test the timer ticks at the configured rate."""
+        controller = make_controller(250)
+
+        assert controller.timer.interval() == 250
+
+    def test_set_update_interval_changes_running_timer(self, qapp):
+        """Test a new interval from the settings dialog takes effect and keeps the timer running."""
+        controller = make_controller(100)
+        controller.start()
+
+        controller.set_update_interval(400)
+
+        assert controller.update_interval == 400
+        assert controller.timer.interval() == 400
+        assert controller.is_running()
+        controller.stop()
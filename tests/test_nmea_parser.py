@@ -55,49 +55,21 @@ class TestNMEAParserGGA:
     def parser(self, gps_data):
         return NMEAParser(gps_data)
 
-    def test_parse_gga_extracts_position(self, parser, gps_data):
-        """Test GGA sentence extracts latitude and longitude."""
+    def test_parse_gga_extracts_all_fields(self, parser, gps_data):
+        """Test GGA sentence extracts position, directions, altitude, satellites and quality."""
         # Valid GGA sentence with correct checksum
         sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F"
 
         result = parser.parse_sentence(sentence)
 
         assert result is True
-        # pynmea2 converts to decimal degrees
+        # Converted to decimal degrees
         assert gps_data.latitude == pytest.approx(48.1173, rel=0.001)
         assert gps_data.longitude == pytest.approx(11.5167, rel=0.001)
-
-    def test_parse_gga_extracts_direction(self, parser, gps_data):
-        """Test GGA sentence extracts lat/lon directions."""
-        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F"
-
-        parser.parse_sentence(sentence)
-
         assert gps_data.lat_dir == 'N'
         assert gps_data.lon_dir == 'E'
-
-    def test_parse_gga_extracts_altitude(self, parser, gps_data):
-        """Test GGA sentence extracts altitude."""
-        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F"
-
-        parser.parse_sentence(sentence)
-
         assert gps_data.height == pytest.approx(545.4, rel=0.01)
-
-    def test_parse_gga_extracts_satellites(self, parser, gps_data):
-        """Test GGA sentence extracts satellite count."""
-        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F"
-
-        parser.parse_sentence(sentence)
-
         assert gps_data.num_sats == 8
-
-    def test_parse_gga_extracts_quality(self, parser, gps_data):
-        """Test GGA sentence extracts GPS quality indicator."""
-        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F"
-
-        parser.parse_sentence(sentence)
-
         assert gps_data.gps_quality == 1
 
     def test_parse_gga_no_fix(self, parser, gps_data):
@@ -110,6 +82,34 @@ class TestNMEAParserGGA:
         assert gps_data.gps_quality == 0
         assert gps_data.num_sats == 0
 
+    def test_parse_gga_rejects_bad_checksum(self, parser, gps_data):
+        """Test a GGA sentence whose checksum does not match is discarded."""
+        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4E"
+
+        assert parser.parse_sentence(sentence) is False
+        assert gps_data == GPSData()
+
+    def test_parse_gga_skips_checksum_when_verified_upstream(self, parser, gps_data):
+        """Test verify_checksum=False accepts a sentence without checking its checksum."""
+        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4E"
+
+        assert parser.parse_sentence(sentence, verify_checksum=False) is True
+        assert gps_data.num_sats == 8
+
+    def test_parse_gga_without_checksum(self, parser, gps_data):
+        """Test a GGA sentence without a checksum is accepted, as pynmea2 does."""
+        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,"
+
+        assert parser.parse_sentence(sentence) is True
+        assert gps_data.num_sats == 8
+
+    def test_parse_gga_malformed_field_leaves_data_untouched(self, parser, gps_data):
+        """Test a GGA sentence with an empty fix quality is discarded without partial updates."""
+        sentence = "$GPGGA,123519,4807.038,N,01131.000,E,,08,0.9,545.4,M,47.0,M,,*7E"
+
+        assert parser.parse_sentence(sentence) is False
+        assert gps_data == GPSData()
+
 
 class TestNMEAParserRMC:
     """Tests for parsing RMC (Recommended Minimum) sentences."""
@@ -137,6 +137,54 @@ class TestNMEAParserRMC:
         assert gps_data.lat_dir == 'S'
         assert gps_data.lon_dir == 'W'
 
+    def test_parse_rmc_southern_western_position_is_negative(self, parser, gps_data):
+        """Test RMC positions south and west are signed negative."""
+        sentence = "$GPRMC,123519,A,4807.038,S,01131.000,W,022.4,084.4,230394,003.1,W*65"
+
+        parser.parse_sentence(sentence)
+
+        assert gps_data.latitude == pytest.approx(-48.1173, rel=0.001)
+        assert gps_data.longitude == pytest.approx(-11.5167, rel=0.001)
+
+
+class TestNMEAParserGLL:
+    """Tests for parsing GLL (Geographic Position) sentences."""
+
+    def test_parse_gll_extracts_position(self, gps_data):
+        """Test GLL sentence extracts position and directions."""
+        parser = NMEAParser(gps_data)
+
+        assert parser.parse_sentence("$GPGLL,4916.45,N,12311.12,W,225444,A*31") is True
+        assert gps_data.latitude == pytest.approx(49.2742, rel=1e-5)
+        assert gps_data.longitude == pytest.approx(-123.1853, rel=1e-5)
+        assert gps_data.lat_dir == 'N'
+        assert gps_data.lon_dir == 'W'
+
+
+class TestNMEAParserGNS:
+    """Tests for parsing GNS (GNSS Fix Data) sentences through pynmea2."""
+
+    GNS = "$GPGNS,014035.00,4332.69262,S,17235.48549,E,RR,13,0.9,25.63,11.24,,*6E"
+
+    def test_parse_gns_extracts_fix(self, gps_data):
+        """Test GNS sentence extracts position, altitude and satellite count."""
+        parser = NMEAParser(gps_data)
+
+        assert parser.parse_sentence(self.GNS) is True
+        assert gps_data.latitude == pytest.approx(-43.5449, rel=1e-5)
+        assert gps_data.longitude == pytest.approx(172.5914, rel=1e-5)
+        assert gps_data.height == pytest.approx(25.63)
+        assert gps_data.num_sats == 13
+
+    def test_parse_gns_repeatedly(self, gps_data):
+        """Test later GNS sentences are applied like the first."""
+        parser = NMEAParser(gps_data)
+        parser.parse_sentence(self.GNS)
+        gps_data.num_sats = 0
+
+        assert parser.parse_sentence(self.GNS) is True
+        assert gps_data.num_sats == 13
+
 
 class TestNMEAParserMultipleSentences:
     """Tests for parsing multiple NMEA sentences."""
@@ -161,3 +209,40 @@ class TestNMEAParserMultipleSentences:
         assert gps_data.latitude != initial_lat
         assert gps_data.num_sats == 10
         assert gps_data.height == pytest.approx(600.0, rel=0.01)
+
+    def test_parse_buffer_parses_each_gps_sentence(self, parser, gps_data):
+        """Test a multi-sentence buffer is parsed in order, skipping non-GPS lines."""
+        buffer = ("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n"
+                  "$GLGSV,1,1,00*65\r\n"
+                  "$GPGGA,123520,4907.038,N,01231.000,E,1,10,0.8,600.0,M,47.0,M,,*49\r\n")
+
+        assert parser.parse_buffer(buffer) == 2
+        assert gps_data.num_sats == 10
+        assert gps_data.height == pytest.approx(600.0, rel=0.01)
+
+    def test_parse_buffer_skips_bad_sentence(self, parser, gps_data):
+        """Test a sentence with a bad checksum is not counted and does not stop the rest."""
+        buffer = ("$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*00\r\n"
+                  "$GPGGA,123520,4907.038,N,01231.000,E,1,10,0.8,600.0,M,47.0,M,,*49\r\n")
+
+        assert parser.parse_buffer(buffer) == 1
+        assert gps_data.num_sats == 10
+
+    def test_parse_sentence_ignores_unused_types(self, parser, gps_data):
+        """Test GPS sentences without fields GPSData uses are skipped."""
+        assert not parser.parse_sentence("$GPGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1*39")
+        assert not parser.parse_sentence("$GPGSV,1,1,01,01,40,083,46*4E")
+        assert gps_data == GPSData()
+
+    def test_parse_buffer_skips_unused_types(self, parser, gps_data):
+        """Test unused GPS sentence types in a buffer are not counted or parsed."""
+        buffer = ("$GPGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1*39\r\n"
+                  "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F\r\n"
+                  "$GPVTG,054.7,T,034.4,M,005.5,N,010.2,K*48\r\n")
+
+        assert parser.parse_buffer(buffer) == 1
+        assert gps_data.num_sats == 8
+
+    def test_parse_buffer_empty(self, parser):
+        """Test an empty buffer parses nothing."""
+        assert parser.parse_buffer("") == 0
@@ -0,0 +1,136 @@
+"""
+Tests for the display panels.
+"""
+import math
+
+import pytest
+from gps_data import PositionInfo
+from Panels.base_panel import BasePanel, format_variable_precision
+from Panels.panel_constants import INVALID_VALUE_TEXT
+from Panels.position_panel import PositionPanel
+
+POSITION = PositionInfo(latitude=48.1173, lat_err=0.00832, longitude=11.5167, lon_err=0.0004,
+                        lat_dir='N', lon_dir='E', height=545.4, height_err=0.25)
+
+
+def process_events_until(qapp, condition, attempts=50):
+    """Process pending events until condition() holds or the attempts run out."""
+    for _ in range(attempts):
+        if condition():
+            return True
+        qapp.processEvents()
+    return condition()
+
+
+class TestFormatVariablePrecision:
+    """Tests for value ± error formatting."""
+
+    def test_error_sets_decimal_places(self):
+        """Test the value is rounded to the error's first significant figure."""
+        assert format_variable_precision(48.1173, 0.00832) == "48.117 ± 0.008"
+
+    def test_zero_and_infinite_error_use_two_places(self):
+        """Test errors without a magnitude fall back to two decimal places."""
+        assert format_variable_precision(48.1173, 0.0) == "48.12 ± 0.00"
+        assert format_variable_precision(48.1173, math.inf) == "48.12 ± inf"
+
+
+class TestSetValueSafe:
+    """Tests for value label text."""
+
+    @pytest.fixture
+    def panel(self, qapp):
+        return BasePanel()
+
+    @pytest.fixture
+    def label(self, panel):
+        return panel.create_value_label("0.0")
+
+    def test_value_with_units_and_direction(self, panel, label):
+        """Test a value is shown with its error, units and direction."""
+        panel._set_value_safe(label, 48.1173, 0.00832, "°", "N")
+
+        assert label.text() == "(48.117 ± 0.008)° N"
+
+    def test_zero_error(self, panel, label):
+        """Test a zero error, as from a stationary fix, shows two decimal places."""
+        panel._set_value_safe(label, 48.1173, 0.0, "°", "N")
+
+        assert label.text() == "(48.12 ± 0.00)° N"
+
+    def test_formatter_from_create_value_label_with_format(self, panel):
+        """Test a pre-built formatter produces the same text as plain units."""
+        label, formatter = panel.create_value_label_with_format("0.0", " m")
+
+        panel._set_value_safe(label, 545.4, 0.25, formatter)
+
+        assert label.text() == "(545.4 ± 0.2) m "
+
+    @pytest.mark.parametrize("value, error", [
+        (math.nan, 0.1),
+        (48.1173, math.nan),
+        (None, 0.1),
+        (48.1173, None),
+        ("not a number", 0.1),
+    ])
+    def test_invalid_input_shows_placeholder(self, panel, label, value, error):
+        """Test values that cannot be displayed show the invalid-value text."""
+        panel._set_value_safe(label, value, error, "°", "N")
+
+        assert label.text() == INVALID_VALUE_TEXT
+
+    def test_recovers_after_invalid_input(self, panel, label):
+        """Test a valid value replaces the placeholder."""
+        panel._set_value_safe(label, None, None, "°", "N")
+        panel._set_value_safe(label, 48.1173, 0.00832, "°", "N")
+
+        assert label.text() == "(48.117 ± 0.008)° N"
+
+
+class TestPositionPanel:
+    """Tests for the deferred position update."""
+
+    @pytest.fixture
+    def panel(self, qapp):
+        return PositionPanel()
+
+    def test_set_position_applies_on_next_event_loop_pass(self, qapp, panel):
+        """Test labels keep their text until the event loop runs the flush."""
+        panel.set_position(POSITION)
+
+        assert panel.latitude.text() == "0.0"
+        assert process_events_until(qapp, lambda: panel.latitude.text() != "0.0")
+        assert panel.latitude.text() == "(48.117 ± 0.008)° N"
+        assert panel.longitude.text() == "(11.5167 ± 0.0004)° E"
+        assert panel.height.text() == "(545.4 ± 0.2) m "
+
+    def test_burst_applies_only_the_latest_position(self, qapp, panel):
+        """Test several positions set in one pass collapse into one update of the last one."""
+        applied = []
+        original_apply = panel._apply
+        panel._apply = lambda p: applied.append(p) or original_apply(p)
+
+        panel.set_position(POSITION._replace(latitude=10.0))
+        panel.set_position(POSITION)
+        process_events_until(qapp, lambda: bool(applied))
+        qapp.processEvents()
+
+        assert applied == [POSITION]
+
+    def test_equal_position_does_not_flush(self, qapp, panel):
+        """Test an equal PositionInfo schedules no flush."""
+        panel.set_position(POSITION)
+        assert process_events_until(qapp, lambda: not panel._flush_timer.isActive())
+
+        panel.set_position(PositionInfo(*POSITION))
+
+        assert not panel._flush_timer.isActive()
+
+    def test_static_labels_are_drawn_from_backdrop(self, panel):
+        """Test the title and key labels are handed to the cached backdrop while values stay live."""
+        image = panel.grab().toImage()
+
+        assert not image.isNull()
+        assert all(label.isHidden() for label in panel.findChildren(type(panel.latitude))
+                   if label.text() in ("Position", "Latitude: ", "Longitude: ", "Height: "))
+        assert not panel.latitude.isHidden()
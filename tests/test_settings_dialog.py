@@ -0,0 +1,38 @@
+"""
+Tests for the settings dialog.
+"""
+import pytest
+from settings_dialog import SettingsDialog
+
+PORTS = [("/dev/ttyUSB10", "u-blox 7"), ("/dev/ttyUSB1", "u-blox 7")]
+
+
+class TestPopulatePorts:
+    """Tests for restoring the port choice after a scan."""
+
+    @pytest.fixture
+    def dialog(self, qapp):
+        dialog = SettingsDialog(current_port="/dev/ttyUSB1")
+        yield dialog
+        dialog.deleteLater()
+
+    def test_current_port_selects_its_exact_entry(self, dialog):
+        """Test a port that prefixes another device's name selects its own entry."""
+        dialog._populate_ports(PORTS)
+
+        assert dialog.port_combo.currentText() == "/dev/ttyUSB1 - u-blox 7"
+        assert dialog.get_settings()['port'] == "/dev/ttyUSB1"
+
+    def test_rescan_keeps_selected_entry(self, dialog):
+        """Test a selected scanned entry is still selected after another scan."""
+        dialog._populate_ports(PORTS)
+        dialog._populate_ports(list(reversed(PORTS)))
+
+        assert dialog.port_combo.currentText() == "/dev/ttyUSB1 - u-blox 7"
+
+    def test_unlisted_port_keeps_typed_text(self, dialog):
+        """Test a port the scan did not find stays as typed."""
+        dialog._populate_ports([("/dev/ttyUSB10", "u-blox 7")])
+
+        assert dialog.port_combo.currentText() == "/dev/ttyUSB1"
+        assert dialog.get_settings()['port'] == "/dev/ttyUSB1"
@@ -0,0 +1,99 @@
+"""
+Tests for SettingsMediator.
+"""
+import pytest
+from settings_mediator import SettingsMediator
+
+
+class FakeConnectionManager:
+    """Connection manager that records reconnects instead of opening ports."""
+
+    def __init__(self, port="/dev/ttyUSB0", baudrate=9600, is_connected=True):
+        self.port = port
+        self.baudrate = baudrate
+        self.is_connected = is_connected
+        self.reconnects = 0
+
+    def update_connection_params(self, port=None, baudrate=None):
+        if port is not None:
+            self.port = port
+        if baudrate is not None:
+            self.baudrate = baudrate
+        self.reconnects += 1
+
+
+class FakeUpdateController:
+    """Update controller that records interval changes."""
+
+    def __init__(self, update_interval=100, reconnect_interval=5000):
+        self.update_interval = update_interval
+        self.reconnect_interval = reconnect_interval
+        self.calls = []
+
+    def set_update_interval(self, interval_ms):
+        self.update_interval = interval_ms
+        self.calls.append(('update', interval_ms))
+
+    def set_reconnect_interval(self, interval_ms):
+        self.reconnect_interval = interval_ms
+        self.calls.append(('reconnect', interval_ms))
+
+
+@pytest.fixture
+def connection_manager():
+    """Create a connected fake connection manager."""
+    return FakeConnectionManager()
+
+
+@pytest.fixture
+def update_controller():
+    """Create a fake update controller."""
+    return FakeUpdateController()
+
+
+@pytest.fixture
+def mediator(connection_manager, update_controller):
+    """Create a settings mediator over the fakes."""
+    return SettingsMediator(connection_manager, update_controller)
+
+
+class TestApplySettings:
+    """Tests for applying settings from the dialog."""
+
+    def test_unchanged_settings_do_nothing(self, mediator, connection_manager, update_controller):
+        """Test saving the current settings neither reconnects nor touches the timers."""
+        messages = []
+
+        mediator.apply_settings(mediator.get_current_settings(), callback=messages.append)
+
+        assert connection_manager.reconnects == 0
+        assert update_controller.calls == []
+        assert messages == []
+
+    def test_changed_interval_only_updates_timer(self, mediator, connection_manager, update_controller):
+        """Test an interval change does not reconnect."""
+        settings = dict(mediator.get_current_settings(), update_interval=250)
+
+        mediator.apply_settings(settings)
+
+        assert update_controller.calls == [('update', 250)]
+        assert connection_manager.reconnects == 0
+
+    def test_changed_port_reconnects(self, mediator, connection_manager):
+        """Test a new port reconnects and reports it."""
+        messages = []
+        settings = dict(mediator.get_current_settings(), port="/dev/ttyACM0")
+
+        mediator.apply_settings(settings, callback=messages.append)
+
+        assert connection_manager.reconnects == 1
+        assert connection_manager.port == "/dev/ttyACM0"
+        assert messages == ["Settings applied. Reconnecting to GPS..."]
+
+    def test_unchanged_port_retries_when_disconnected(self, mediator, connection_manager):
+        """Test saving while disconnected still attempts a connection."""
+        connection_manager.is_connected = False
+
+        mediator.apply_settings(mediator.get_current_settings())
+
+        assert connection_manager.reconnects == 1
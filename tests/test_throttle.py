@@ -0,0 +1,50 @@
+"""
+Tests for the Throttled callback wrapper.
+"""
+import time
+
+from throttle import Throttled
+
+
+def run_event_loop(qapp, seconds):
+    """Process events for the given time so timers can fire."""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        qapp.processEvents()
+        time.sleep(0.002)
+
+
+class TestThrottled:
+    """Tests for leading and trailing edge throttling."""
+
+    def test_first_call_runs_immediately(self, qapp):
+        """Test the leading call is not delayed."""
+        calls = []
+        throttled = Throttled(calls.append, 50)
+
+        throttled(1)
+
+        assert calls == [1]
+
+    def test_burst_delivers_first_and_last(self, qapp):
+        """Test calls within an interval collapse into one trailing call with the latest value."""
+        calls = []
+        throttled = Throttled(calls.append, 50)
+
+        for value in range(10):
+            throttled(value)
+        assert calls == [0]
+
+        run_event_loop(qapp, 0.2)
+
+        assert calls == [0, 9]
+
+    def test_quiet_interval_adds_no_trailing_call(self, qapp):
+        """Test a single call is not repeated when the interval ends."""
+        calls = []
+        throttled = Throttled(lambda: calls.append(None), 20)
+
+        throttled()
+        run_event_loop(qapp, 0.1)
+
+        assert calls == [None]